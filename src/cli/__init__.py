@@ -1,11 +1,18 @@
 """CLI command implementations for Claude Code Configuration Manager CLI."""
 
-from .list_command import list_templates
-from .sync_command import sync
-from .apply_command import apply
-from .config_command import config
-from .status_command import status
-from .install_command import install
+from typing import Any
+from importlib import import_module
+
+# Command modules are imported on first attribute access (PEP 562) so that
+# importing one command does not pay for the dependencies of all the others.
+_COMMAND_MODULES = {
+    "apply": ".apply_command",
+    "config": ".config_command",
+    "install": ".install_command",
+    "list_templates": ".list_command",
+    "status": ".status_command",
+    "sync": ".sync_command",
+}
 
 __all__ = [
     "apply",
@@ -15,3 +22,11 @@ __all__ = [
     "status",
     "sync",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a command implementation lazily."""
+    module_name = _COMMAND_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module_name, __name__), name)
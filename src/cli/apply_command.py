@@ -1,19 +1,18 @@
 """Apply command implementation for project templates."""
 
-import shutil
+import os
 import logging
 import subprocess
 from typing import Annotated
 from pathlib import Path
 
 import typer
+from rich.text import Text
 from rich.console import Console
 
-from ..lib.git_ops import GitOperations
-from ..lib.templates import TemplatesManager
-from ..models.template import TemplateType
 from ..lib.command_base import (
     ConflictError,
+    run_install_script,
     get_command_context,
     sync_repo_if_needed,
     handle_command_error,
@@ -21,7 +20,7 @@ from ..lib.command_base import (
 )
 
 logger = logging.getLogger(__name__)
-console = Console()
+console = Console(highlight=False)
 
 
 def apply(
@@ -38,18 +37,26 @@ def apply(
     This command applies project templates by copying files from the template
     to the target directory for one-time project initialization.
     """
+    # Heavy dependencies are imported here so other subcommands never load them
+    from ..lib.git_ops import GitOperations
+    from ..lib.templates import TemplatesManager
+    from ..models.template import TemplateType
+
     try:
         # Get unified command context (replaces all the manual parsing above)
         context = get_command_context()
         ensure_repository_configured(context)
+        is_text = context.output_format == "text"
 
         # Determine target directory (Typer already parsed as Path)
         target_dir = target if target else Path.cwd()
-        target_dir = target_dir.resolve()
+        # abspath is pure string handling; symlinked components are kept as-is, which is
+        # fine because apply_template and relative_to() both work from this same path
+        target_dir = Path(os.path.abspath(target_dir))
 
         # Setup managers
         git_ops = GitOperations()
-        templates_manager = TemplatesManager()
+        templates_manager = TemplatesManager(max_workers=context.config.max_parallel_operations)
 
         # Get repository cache directory
         repo_cache_dir = context.config.get_repo_cache_dir()
@@ -58,7 +65,9 @@ def apply(
         sync_repo_if_needed(context, git_ops)
 
         # Find requested project template using helper (raises ConfigurationError if missing)
-        template = git_ops.get_template_by_name(repo_cache_dir, template_name, TemplateType.PROJECT)
+        template = git_ops.get_template_by_name(
+            repo_cache_dir, template_name, TemplateType.PROJECT, cache_dir=context.config.get_template_cache_dir()
+        )
 
         # Check for conflicts
         if not force:
@@ -74,7 +83,7 @@ def apply(
                         raise ConflictError("Operation aborted by user due to file conflicts")
 
         # Apply template
-        if context.output_format == "text":
+        if is_text:
             console.print(f"Applying project template: [bold]{template_name}[/bold]")
             if template.description:
                 console.print(f"Description: {template.description}")
@@ -84,52 +93,39 @@ def apply(
             template, repo_cache_dir, target_dir, force=force, dry_run=dry_run
         )
 
-        if context.output_format == "text":
+        if is_text:
             if dry_run:
                 console.print(f"[yellow]DRY RUN: Would copy {len(project_files)} files[/yellow]")
 
-            for project_file in project_files:
-                status = "✓" if success else "✗"
-                relative_target = project_file.target.relative_to(target_dir)
-                console.print(f"{status} {relative_target} copied")
+            # One render for the whole report; paths are printed verbatim (no markup)
+            status = "✓" if success else "✗"
+            lines = [f"{status} {project_file.relative_target} copied" for project_file in project_files]
+            if lines:
+                console.print("\n".join(lines), markup=False, highlight=False)
 
             # Handle install script
-            if template.has_install_script() and not no_script:
-                script_path = template.get_install_script_path()
-                if script_path and script_path.exists():
-                    if not dry_run:
-                        run_script = typer.confirm("Run install.sh script?")
-                        if run_script:
-                            try:
-                                # Copy script to target directory temporarily for execution
-                                temp_script = target_dir / "install.sh"
-                                if not temp_script.exists():
-                                    shutil.copy2(script_path, temp_script)
-                                    temp_script.chmod(0o755)
-
-                                result = subprocess.run(
-                                    [str(temp_script)], cwd=target_dir, check=True, capture_output=True, text=True
-                                )
-                                console.print("✓ Executed install.sh successfully")
-                                if context.verbose and result.stdout:
-                                    console.print(result.stdout)
-
-                                # Clean up temp script if we created it
-                                if temp_script.exists() and temp_script != script_path:
-                                    temp_script.unlink()
-
-                            except subprocess.CalledProcessError as e:
-                                console.print(f"[red]✗ Install script failed: {e}[/red]")
-                                if e.stderr:
-                                    console.print(f"[red]{e.stderr}[/red]")
-                    else:
-                        console.print("[yellow]DRY RUN: Would prompt to run install.sh[/yellow]")
+            # Discovery only records install.sh when it found the file, so no extra stat here
+            script_path = template.install_script_path
+            if script_path is not None and not no_script:
+                if not dry_run:
+                    run_script = typer.confirm("Run install.sh script?")
+                    if run_script:
+                        try:
+                            # Run in place via bash: no temp copy in target_dir and no chmod of the cache
+                            run_install_script(["bash", str(script_path)], target_dir, verbose=context.verbose)
+                            console.print("✓ Executed install.sh successfully")
+                        except subprocess.CalledProcessError as e:
+                            console.print(Text(f"✗ Install script failed: {e}", style="red"))
+                            if e.stderr:
+                                console.print(Text(e.stderr, style="red"))
+                else:
+                    console.print("[yellow]DRY RUN: Would prompt to run install.sh[/yellow]")
 
         if success:
-            if context.output_format == "text":
+            if is_text:
                 console.print(f"[green]Template '{template_name}' applied successfully[/green]")
         else:
-            if context.output_format == "text":
+            if is_text:
                 console.print(f"[red]Template '{template_name}' application failed[/red]")
             raise ConflictError(f"Template '{template_name}' application failed")
 
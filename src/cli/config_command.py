@@ -1,8 +1,10 @@
 """Config command implementation for configuration management."""
 
 import logging
+from collections.abc import Callable, Iterable
 
 import typer
+from rich.text import Text
 from rich.console import Console
 
 from ..lib.render import render_json
@@ -10,11 +12,46 @@ from ..lib.command_base import ConfigurationError, get_command_context, handle_c
 from ..models.config_loader import CLIConfig
 
 logger = logging.getLogger(__name__)
-console = Console()
+console = Console(highlight=False)
 
 # Create config subcommand app
 config_app = typer.Typer(name="config", help="Manage CLI configuration")
 
+# Dotted key -> accessor tables; the valid-keys hints are derived from these
+_GETTERS: dict[str, Callable[[CLIConfig], str]] = {
+    "repository.url": lambda c: c.default_repo_url or "Not set",
+    "repository.branch": lambda c: c.repo_branch,
+    "repository.shallow": lambda c: str(c.shallow).lower(),
+    "config.dir": lambda c: str(c.config_dir),
+    "user.home": lambda c: str(c.user_home),
+}
+
+_SETTERS: dict[str, Callable[[CLIConfig, str], None]] = {
+    "repository.url": lambda c, v: setattr(c, "default_repo_url", v),
+    "repository.branch": lambda c, v: setattr(c, "repo_branch", v),
+    "repository.shallow": lambda c, v: setattr(c, "shallow", v),
+}
+
+_UNSETTERS: dict[str, Callable[[CLIConfig], None]] = {
+    "repository.url": lambda c: setattr(c, "default_repo_url", None),
+    "repository.branch": lambda c: setattr(c, "repo_branch", "main"),  # Reset to default
+    "repository.shallow": lambda c: setattr(c, "shallow", True),  # Reset to default
+}
+
+# Computed settings that are recognised but cannot be set: (error, explanation)
+_COMPUTED_KEYS: dict[str, tuple[str, str]] = {
+    "cache.dir": ("Cache directory cannot be set directly", "It is computed from config directory and repository URL"),
+    "auto.sync": ("Auto sync cannot be set directly", "It is computed from repository configuration"),
+    "auto_sync": ("Auto sync cannot be set directly", "It is computed from repository configuration"),
+}
+
+
+def _unknown_key(key: str, valid_keys: Iterable[str]) -> ConfigurationError:
+    """Print the unknown-key error with the valid keys and return the exception to raise."""
+    console.print(Text(f"Error: Unknown configuration key '{key}'", style="red"))
+    console.print(f"Valid keys: {', '.join(valid_keys)}")
+    return ConfigurationError(f"Unknown configuration key '{key}'")
+
 
 @config_app.command(name="list")
 def list_config():
@@ -31,6 +68,7 @@ def list_config():
             console.print("[bold]All Configuration Settings:[/bold]")
             console.print(f"repository.url: {config.default_repo_url or '[red]Not set[/red]'}")
             console.print(f"repository.branch: {config.repo_branch}")
+            console.print(f"repository.shallow: {str(config.shallow).lower()}")
             console.print(f"config.dir: {config.config_dir}")
             console.print(f"user.home: {config.user_home}")
 
@@ -47,23 +85,11 @@ def get_config(
         context = get_command_context()
         config = context.config
 
-        # Parse nested keys
-        keys = key.split(".")
-
-        if keys == ["repository", "url"]:
-            value = config.default_repo_url or "Not set"
-        elif keys == ["repository", "branch"]:
-            value = config.repo_branch
-        elif keys == ["config", "dir"]:
-            value = str(config.config_dir)
-        elif keys == ["user", "home"]:
-            value = str(config.user_home)
-        else:
-            console.print(f"[red]Error: Unknown configuration key '{key}'[/red]")
-            console.print("Valid keys: repository.url, repository.branch, config.dir, user.home")
-            raise ConfigurationError(f"Unknown configuration key '{key}'")
+        getter = _GETTERS.get(key)
+        if getter is None:
+            raise _unknown_key(key, _GETTERS)
 
-        console.print(f"{key}: {value}")
+        console.print(f"{key}: {getter(config)}")
 
     except Exception as e:
         handle_command_error(e)
@@ -105,7 +131,9 @@ def show_config():
 
 @config_app.command(name="set")
 def set_config(
-    key: str = typer.Argument(..., help="Configuration key (e.g., repository.url, repository.branch)"),
+    key: str = typer.Argument(
+        ..., help="Configuration key (e.g., repository.url, repository.branch, repository.shallow)"
+    ),
     value: str = typer.Argument(..., help="Configuration value"),
 ):
     """Set configuration value."""
@@ -113,25 +141,16 @@ def set_config(
         context = get_command_context()
         config = context.config
 
-        # Parse nested keys
-        keys = key.split(".")
-
-        if keys == ["repository", "url"]:
-            config.default_repo_url = value
-        elif keys == ["repository", "branch"]:
-            config.repo_branch = value
-        elif keys == ["cache", "dir"]:
-            console.print("[red]Error: Cache directory cannot be set directly[/red]")
-            console.print("It is computed from config directory and repository URL")
-            raise ConfigurationError("Cache directory cannot be set directly")
-        elif keys == ["auto", "sync"] or keys == ["auto_sync"]:
-            console.print("[red]Error: Auto sync cannot be set directly[/red]")
-            console.print("It is computed from repository configuration")
-            raise ConfigurationError("Auto sync cannot be set directly")
-        else:
-            console.print(f"[red]Error: Unknown configuration key '{key}'[/red]")
-            console.print("Valid keys: repository.url, repository.branch")
-            raise ConfigurationError(f"Unknown configuration key '{key}'")
+        setter = _SETTERS.get(key)
+        if setter is None:
+            if key in _COMPUTED_KEYS:
+                message, explanation = _COMPUTED_KEYS[key]
+                console.print(Text(f"Error: {message}", style="red"))
+                console.print(explanation)
+                raise ConfigurationError(message)
+            raise _unknown_key(key, _SETTERS)
+
+        setter(config, value)
 
         # Save configuration
         config.save_to_file()
@@ -154,17 +173,11 @@ def unset_config(
         context = get_command_context()
         config = context.config
 
-        # Parse nested keys
-        keys = key.split(".")
+        unsetter = _UNSETTERS.get(key)
+        if unsetter is None:
+            raise _unknown_key(key, _UNSETTERS)
 
-        if keys == ["repository", "url"]:
-            config.default_repo_url = None
-        elif keys == ["repository", "branch"]:
-            config.repo_branch = "main"  # Reset to default
-        else:
-            console.print(f"[red]Error: Unknown configuration key '{key}'[/red]")
-            console.print("Valid keys: repository.url, repository.branch")
-            raise ConfigurationError(f"Unknown configuration key '{key}'")
+        unsetter(config)
 
         # Save configuration
         config.save_to_file()
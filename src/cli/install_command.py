@@ -5,13 +5,12 @@ import subprocess
 from typing import Annotated
 
 import typer
+from rich.text import Text
 from rich.console import Console
 
-from ..lib.git_ops import GitOperations
-from ..lib.dotfiles import DotfilesManager
-from ..models.template import TemplateType
 from ..lib.command_base import (
     ConflictError,
+    run_install_script,
     get_command_context,
     sync_repo_if_needed,
     handle_command_error,
@@ -19,7 +18,7 @@ from ..lib.command_base import (
 )
 
 logger = logging.getLogger(__name__)
-console = Console()
+console = Console(highlight=False)
 
 
 def install(
@@ -33,14 +32,22 @@ def install(
     This command installs dotfiles templates by creating symbolic links
     from your home directory to files in the configuration repository.
     """
+    # Heavy dependencies are imported here so other subcommands never load them
+    from ..lib.git_ops import GitOperations
+    from ..lib.dotfiles import DotfilesManager
+    from ..models.template import TemplateType
+
     try:
         # Get unified command context
         context = get_command_context()
         ensure_repository_configured(context)
+        is_text = context.output_format == "text"
 
         # Setup managers
         git_ops = GitOperations()
-        dotfiles_manager = DotfilesManager(user_home=context.config.user_home)
+        dotfiles_manager = DotfilesManager(
+            user_home=context.config.user_home, max_workers=context.config.max_parallel_operations
+        )
 
         # Get repository cache directory
         repo_cache_dir = context.config.get_repo_cache_dir()
@@ -49,59 +56,59 @@ def install(
         sync_repo_if_needed(context, git_ops)
 
         # Find requested dotfiles template using helper (raises ConfigurationError if missing)
-        template = git_ops.get_template_by_name(repo_cache_dir, template_name, TemplateType.DOTFILES)
+        template = git_ops.get_template_by_name(
+            repo_cache_dir, template_name, TemplateType.DOTFILES, cache_dir=context.config.get_template_cache_dir()
+        )
 
         # Install template
-        if context.output_format == "text":
+        if is_text:
             console.print(f"Installing dotfiles template: [bold]{template_name}[/bold]")
             if template.description:
                 console.print(f"Description: {template.description}")
 
         success, links = dotfiles_manager.install_template(template, repo_cache_dir, force=force, dry_run=dry_run)
 
-        if context.output_format == "text":
+        if is_text:
             if dry_run:
                 console.print(f"[yellow]DRY RUN: Would create {len(links)} symlinks[/yellow]")
 
-            for link in links:
-                status = "✓" if success else "✗"
-                console.print(f"{status} {link.target} -> {link.source}")
+            # One render for the whole report; paths are printed verbatim (no markup)
+            status = "✓" if success else "✗"
+            lines = [f"{status} {link.target} -> {link.source}" for link in links]
+            if lines:
+                console.print("\n".join(lines), markup=False, highlight=False)
 
             # Handle install script
-            if template.has_install_script() and not no_script:
-                script_path = template.get_install_script_path()
-                if script_path and script_path.exists():
-                    if not dry_run:
-                        run_script = typer.confirm("Run install.sh script?")
-                        if run_script:
-                            try:
-                                # Prefer invoking via bash to avoid executable-bit issues
-                                result = subprocess.run(
-                                    ["bash", str(script_path)],
-                                    cwd=script_path.parent,
-                                    check=True,
-                                    capture_output=True,
-                                    text=True,
-                                )
-                                console.print("✓ Executed install.sh successfully")
-                                if context.verbose and result.stdout:
-                                    console.print(result.stdout)
-                            except subprocess.CalledProcessError as e:
-                                console.print(f"[red]✗ Install script failed: {e}[/red]")
-                                if e.stderr:
-                                    console.print(f"[red]{e.stderr}[/red]")
-                            except PermissionError as e:
-                                console.print(
-                                    f"[red]✗ Permission error executing install.sh: {e}. Try 'chmod +x {script_path}' or ensure file is readable.[/red]"
+            # Discovery only records install.sh when it found the file, so no extra stat here
+            script_path = template.install_script_path
+            if script_path is not None and not no_script:
+                if not dry_run:
+                    run_script = typer.confirm("Run install.sh script?")
+                    if run_script:
+                        try:
+                            # Prefer invoking via bash to avoid executable-bit issues
+                            run_install_script(["bash", str(script_path)], script_path.parent, verbose=context.verbose)
+                            console.print("✓ Executed install.sh successfully")
+                        except subprocess.CalledProcessError as e:
+                            console.print(Text(f"✗ Install script failed: {e}", style="red"))
+                            if e.stderr:
+                                console.print(Text(e.stderr, style="red"))
+                        except PermissionError as e:
+                            console.print(
+                                Text(
+                                    f"✗ Permission error executing install.sh: {e}. "
+                                    f"Try 'chmod +x {script_path}' or ensure file is readable.",
+                                    style="red",
                                 )
-                    else:
-                        console.print("[yellow]DRY RUN: Would prompt to run install.sh[/yellow]")
+                            )
+                else:
+                    console.print("[yellow]DRY RUN: Would prompt to run install.sh[/yellow]")
 
         if success:
-            if context.output_format == "text":
+            if is_text:
                 console.print(f"[green]Template '{template_name}' installed successfully[/green]")
         else:
-            if context.output_format == "text":
+            if is_text:
                 console.print(f"[red]Template '{template_name}' installation failed[/red]")
             raise ConflictError(f"Template '{template_name}' installation failed")
 
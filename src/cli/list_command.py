@@ -1,28 +1,38 @@
 """List command implementation for available templates."""
 
+import re
+import fnmatch
 import logging
+from collections.abc import Sequence
 
 import typer
 from rich.console import Console
 
 from ..lib.render import render_json, render_text_templates
-from ..lib.git_ops import GitOperations
 from ..models.enums import TemplateKind
+from ..models.template import Template, TemplateType
 from ..lib.command_base import (
     get_command_context,
     sync_repo_if_needed,
     handle_command_error,
+    discover_templates_for,
     ensure_repository_configured,
 )
 
 logger = logging.getLogger(__name__)
-console = Console()
+console = Console(highlight=False)
 
 
 _PATTERN_ARG = typer.Argument(None, help="Filter templates by pattern (glob-style)")
 _TYPE_OPTION = typer.Option(TemplateKind.ALL, "--type", help="Filter by type")
 _DETAILED_OPTION = typer.Option(False, "--detailed", "-d", help="Show detailed information including descriptions")
 
+_KIND_TO_TYPE = {
+    TemplateKind.ALL: None,
+    TemplateKind.DOTFILES: TemplateType.DOTFILES,
+    TemplateKind.PROJECTS: TemplateType.PROJECT,
+}
+
 
 def list_templates(
     pattern: str | None = _PATTERN_ARG,
@@ -33,6 +43,9 @@ def list_templates(
 
     Shows all available templates with optional filtering by pattern and type.
     """
+    # Heavy dependencies are imported here so other subcommands never load them
+    from ..lib.git_ops import GitOperations
+
     try:
         # Unified command context and config
         context = get_command_context()
@@ -44,28 +57,22 @@ def list_templates(
         # Unified sync/clone logic
         sync_repo_if_needed(context, git_ops)
 
-        # Discover templates
-        templates = git_ops.discover_templates(repo_cache_dir)
-
-        # Filter by type
-        if template_type == TemplateKind.DOTFILES:
-            templates = [t for t in templates if t.is_dotfiles_template()]
-        elif template_type == TemplateKind.PROJECTS:
-            templates = [t for t in templates if t.is_project_template()]
-        # "all" includes everything
+        # Discover templates, walking only the directory of the requested type ("all" walks both)
+        templates: Sequence[Template] = discover_templates_for(context, git_ops, _KIND_TO_TYPE[template_type])
 
         # Filter by pattern
         if pattern:
-            import fnmatch
-
-            templates = [t for t in templates if fnmatch.fnmatch(t.name, pattern)]
+            # Translate the glob once; fnmatch() would normalize and look it up per template
+            matches = re.compile(fnmatch.translate(pattern)).match
+            templates = [t for t in templates if matches(t.name)]
 
         if not templates:
-            message = "No templates found"
+            parts = ["No templates found"]
             if pattern:
-                message += f" matching pattern '{pattern}'"
+                parts.append(f"matching pattern '{pattern}'")
             if template_type != TemplateKind.ALL:
-                message += f" of type '{template_type.value}'"
+                parts.append(f"of type '{template_type.value}'")
+            message = " ".join(parts)
 
             if context.output_format == "json":
                 render_json({"templates": []})
@@ -82,7 +89,7 @@ def list_templates(
                     "type": template.type,
                     "description": template.description,
                     "files_count": len(template.files),
-                    "has_install_script": template.has_install_script(),
+                    "has_install_script": template.install_script is not None,
                 }
                 if detailed:
                     template_info.update(
@@ -1,23 +1,56 @@
 """Status command implementation for installation status."""
 
+import os
 import logging
+from collections.abc import Sequence
 
 import typer
 from rich.console import Console
 
 from ..lib.render import render_json, render_text_status
-from ..lib.git_ops import GitOperations
-from ..lib.dotfiles import DotfilesManager
-from ..models.template import TemplateType
+from ..lib.fs_batch import LinkProbe, probe_links
+from ..models.template import Template, TemplateType
 from ..lib.command_base import (
     ConfigurationError,
     get_command_context,
     handle_command_error,
+    discover_templates_for,
     ensure_repository_configured,
 )
+from ..models.status_report import LinkStatus, TemplateStatus
 
 logger = logging.getLogger(__name__)
-console = Console()
+console = Console(highlight=False)
+
+
+def _classify_link(target: str, source: str, probe: LinkProbe) -> LinkStatus:
+    """Classify an expected symlink from its batched lstat/readlink probe.
+
+    Args:
+        target: Expected symlink location
+        source: Repository file the symlink should point to
+        probe: (file type, link text) for the link target
+
+    Returns:
+        LinkStatus for the link
+    """
+    mode, raw_source = probe
+    if mode is None:
+        return LinkStatus(target, source, "missing")
+
+    if raw_source is None:
+        return LinkStatus(target, source, "not_symlink")
+
+    # install writes the source path verbatim, so the raw link text normally matches. Relative
+    # links are normalized as strings; only a remaining mismatch pays for a full resolve.
+    if raw_source != source:
+        expected = os.path.normpath(source)
+        if os.path.normpath(os.path.join(os.path.dirname(target), raw_source)) != expected:
+            actual_source = os.path.realpath(target)
+            if actual_source != expected:
+                return LinkStatus(target, source, "wrong_target", actual_source)
+
+    return LinkStatus(target, source, "ok")
 
 
 def status(
@@ -28,6 +61,10 @@ def status(
     Displays information about currently installed dotfiles templates,
     their symlink status, and any broken or missing links.
     """
+    # Heavy dependencies are imported here so other subcommands never load them
+    from ..lib.git_ops import GitOperations
+    from ..lib.dotfiles import DotfilesManager
+
     try:
         # Get unified command context
         context = get_command_context()
@@ -40,65 +77,43 @@ def status(
         # Get repository cache directory
         repo_cache_dir = context.config.get_repo_cache_dir()
 
-        if not repo_cache_dir.exists():
+        if context.repo_cache_stat is None:
             console.print("[yellow]Warning: Repository cache not found. Run 'c3cli sync' first.[/yellow]")
             raise ConfigurationError("Repository cache not found. Run 'c3cli sync' first.")
 
         # Discover templates or fetch single template if filter provided
+        dotfiles_templates: Sequence[Template]
         if template:
             # Use helper for consistent error handling
             single = git_ops.get_template_by_name(repo_cache_dir, template, TemplateType.DOTFILES)
             dotfiles_templates = [single]
         else:
-            templates = git_ops.discover_templates(repo_cache_dir)
-            dotfiles_templates = [t for t in templates if t.is_dotfiles_template()]
+            dotfiles_templates = discover_templates_for(context, git_ops, TemplateType.DOTFILES)
+
+        # Probe every expected link of every template in one batch, then classify in order
+        template_links = [
+            (dotfiles_template, dotfiles_manager.expected_link_paths(dotfiles_template, repo_cache_dir))
+            for dotfiles_template in dotfiles_templates
+        ]
+        probes = iter(
+            probe_links(
+                [target for _, links in template_links for target, _ in links],
+                max_workers=context.config.max_parallel_operations,
+            )
+        )
 
-        # Check status of all dotfiles templates
         status_data = []
-
-        for template in dotfiles_templates:
-            template_status = {
-                "name": template.name,
-                "description": template.description,
-                "installed_links": [],
-                "broken_links": [],
-                "missing_links": [],
-            }
-
-            # Get expected symlinks for this template
-            expected_links = dotfiles_manager.expected_symlinks_for_template(template, repo_cache_dir)
-
-            for link in expected_links:
-                if link.target.exists():
-                    if link.target.is_symlink():
-                        actual_source = link.target.resolve()
-                        if actual_source == link.source:
-                            template_status["installed_links"].append(
-                                {"target": str(link.target), "source": str(link.source), "status": "ok"}
-                            )
-                        else:
-                            template_status["broken_links"].append(
-                                {
-                                    "target": str(link.target),
-                                    "source": str(link.source),
-                                    "actual_source": str(actual_source),
-                                    "status": "wrong_target",
-                                }
-                            )
-                    else:
-                        template_status["broken_links"].append(
-                            {"target": str(link.target), "source": str(link.source), "status": "not_symlink"}
-                        )
-                else:
-                    template_status["missing_links"].append(
-                        {"target": str(link.target), "source": str(link.source), "status": "missing"}
-                    )
-
+        for dotfiles_template, links in template_links:
+            template_status = TemplateStatus(dotfiles_template.name, dotfiles_template.description)
+            buckets = {"ok": template_status.installed_links, "missing": template_status.missing_links}
+            for target, source in links:
+                link_status = _classify_link(target, source, next(probes))
+                buckets.get(link_status.status, template_status.broken_links).append(link_status)
             status_data.append(template_status)
 
         # Output results
         if context.output_format == "json":
-            render_json({"templates": status_data})
+            render_json({"templates": [template_status.to_dict() for template_status in status_data]})
         else:
             render_text_status(status_data, context.config.default_repo_url, repo_cache_dir, verbose=context.verbose)
 
@@ -1,19 +1,21 @@
 """Sync command implementation for repository synchronization."""
 
 import logging
+from collections import Counter
 
 import typer
 from rich.console import Console
 
-from ..lib.git_ops import GitOperations
+from ..models.template import TemplateType
 from ..lib.command_base import (
     get_command_context,
     handle_command_error,
+    discover_templates_for,
     ensure_repository_configured,
 )
 
 logger = logging.getLogger(__name__)
-console = Console()
+console = Console(highlight=False)
 
 
 def sync(
@@ -25,6 +27,9 @@ def sync(
     Updates the local repository cache by pulling the latest changes
     from the configured remote repository.
     """
+    # Heavy dependencies are imported here so other subcommands never load them
+    from ..lib.git_ops import GitOperations
+
     try:
         # Get unified command context
         context = get_command_context()
@@ -43,8 +48,16 @@ def sync(
             console.print(f"Cache directory: {repo_cache_dir}")
 
         # Ensure repository (clone if missing, sync if exists)
-        repo_existed = repo_cache_dir.exists()
-        git_ops.ensure_repo(context.config.default_repo_url, sync_branch, repo_cache_dir, force=force)
+        repo_existed = context.repo_cache_stat is not None
+        git_ops.ensure_repo(
+            context.config.default_repo_url,
+            sync_branch,
+            repo_cache_dir,
+            force=force,
+            shallow=context.config.shallow,
+        )
+        git_ops.clear_template_cache(context.config.get_template_cache_dir())
+        git_ops.mark_synced(repo_cache_dir)
 
         if context.output_format == "text":
             if repo_existed:
@@ -54,9 +67,12 @@ def sync(
 
         # Show template count if verbose
         if context.verbose:
-            templates = git_ops.discover_templates(repo_cache_dir)
-            dotfiles_count = len([t for t in templates if t.is_dotfiles_template()])
-            projects_count = len([t for t in templates if t.is_project_template()])
+            # Goes through the discovery cache so the next command starts warm
+            templates = discover_templates_for(context, git_ops)
+            # Template stores enum values, which hash and compare equal to the str-based members
+            type_counts = Counter(t.type for t in templates)
+            dotfiles_count = type_counts[TemplateType.DOTFILES]
+            projects_count = type_counts[TemplateType.PROJECT]
 
             if context.output_format == "text":
                 console.print(
@@ -1,8 +1,8 @@
 """Core libraries for Claude Code Configuration Manager CLI."""
 
-from .git_ops import GitOperations
-from .dotfiles import DotfilesManager
-from .templates import TemplatesManager
+from typing import Any
+from importlib import import_module
+
 from .command_base import (
     CommandError,
     ConflictError,
@@ -15,6 +15,14 @@ from .command_base import (
     ensure_repository_configured,
 )
 
+# Managers pull in GitPython and the template models, so they are imported on
+# first attribute access (PEP 562) rather than with the package.
+_LAZY_MODULES = {
+    "DotfilesManager": ".dotfiles",
+    "GitOperations": ".git_ops",
+    "TemplatesManager": ".templates",
+}
+
 __all__ = [
     "DotfilesManager",
     "GitOperations",
@@ -29,3 +37,11 @@ __all__ = [
     "handle_command_error",
     "get_command_context",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a manager class lazily."""
+    module_name = _LAZY_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module_name, __name__), name)
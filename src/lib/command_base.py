@@ -5,30 +5,54 @@ across CLI commands. Every command should use these utilities instead of
 manually parsing context and handling errors.
 """
 
+import os
+import sys
 import logging
-from dataclasses import dataclass
+import subprocess
+from typing import TYPE_CHECKING
+from pathlib import Path
+from collections import deque
+from dataclasses import field, dataclass
 
 import click
 import typer
+from pydantic import ValidationError
+from rich.text import Text
 from rich.console import Console
 
+from ..models.template import Template, TemplateType
 from ..models.config_loader import CLIConfig
 
+if TYPE_CHECKING:
+    from .git_ops import GitOperations
+
 logger = logging.getLogger(__name__)
-console = Console()
+console = Console(highlight=False)
+
+# Lines of install script output kept for error reporting
+_SCRIPT_OUTPUT_TAIL = 50
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CommandContext:
     """Unified command context with all necessary configuration.
 
     This eliminates the need for each command to parse ctx.obj manually.
-    All configuration loading and validation happens once in main.py.
+    All configuration loading and validation happens once in main.py, and the
+    context is immutable afterwards (the config object itself stays mutable).
     """
 
     config: CLIConfig
     verbose: bool = False
     output_format: str = "text"
+    repo_override: str | None = None
+    no_sync: bool = False
+    # stat of the repository cache taken when the context was built; None if it did not exist
+    repo_cache_stat: os.stat_result | None = None
+    # Discovery results for this invocation, keyed by (HEAD SHA, template type)
+    template_cache: dict[tuple[str | None, TemplateType | None], tuple[Template, ...]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
 
     @property
     def is_json_output(self) -> bool:
@@ -43,6 +67,7 @@ class CommandContext:
         verbose: bool,
         quiet: bool,  # noqa
         format_type: str | None,
+        no_sync: bool = False,
     ) -> "CommandContext":
         """Create CommandContext directly from CLI arguments.
 
@@ -55,6 +80,7 @@ class CommandContext:
             verbose: Verbose logging flag
             quiet: Quiet logging flag (unused in context but available)
             format_type: Output format string
+            no_sync: Use the repository cache as-is, without syncing
 
         Returns:
             CommandContext with loaded configuration
@@ -63,8 +89,6 @@ class CommandContext:
             ConfigurationError: If configuration is invalid
             RepositoryError: If repository URL is invalid
         """
-        from pathlib import Path
-
         try:
             # Load configuration
             config = CLIConfig.load_from_file(Path(config_path) if config_path else None)
@@ -79,7 +103,22 @@ class CommandContext:
             # Resolve output format: CLI option overrides config
             resolved_format = format_type or config.default_format
 
-            return cls(config=config, verbose=verbose, output_format=resolved_format)
+            # One stat up front answers every "is the cache there yet?" check for this invocation
+            repo_cache_stat = None
+            if config.is_configured():
+                try:
+                    repo_cache_stat = os.stat(config.get_repo_cache_dir())
+                except OSError:
+                    pass
+
+            return cls(
+                config=config,
+                verbose=verbose,
+                output_format=resolved_format,
+                repo_override=repo_override or None,
+                no_sync=no_sync,
+                repo_cache_stat=repo_cache_stat,
+            )
 
         except Exception as e:
             logger.error(f"Failed to create command context: {e}")
@@ -100,16 +139,21 @@ class CommandError(Exception):
         if isinstance(error, CommandError):
             return error
 
-        # Categorize common error types
-        error_str = str(error).lower()
-        if any(keyword in error_str for keyword in ["repository", "git", "clone", "fetch", "remote"]):
-            return RepositoryError(str(error))
-        elif any(keyword in error_str for keyword in ["config", "toml", "validation", "invalid"]):
-            return ConfigurationError(str(error))
-        elif any(keyword in error_str for keyword in ["conflict", "exists", "permission"]):
-            return ConflictError(str(error))
-        else:
-            return cls(str(error))
+        message = str(error)
+        for exc_type, error_cls in _EXCEPTION_CATEGORIES:
+            if isinstance(error, exc_type):
+                return error_cls(message)
+        # GitPython is imported lazily, so its errors can only exist once the module is loaded
+        git = sys.modules.get("git")
+        if git is not None and isinstance(error, git.GitError):
+            return RepositoryError(message)
+
+        # Otherwise categorize by message keywords, first match wins
+        error_str = message.lower()
+        for keywords, error_cls in _ERROR_CATEGORIES:
+            if any(keyword in error_str for keyword in keywords):
+                return error_cls(message)
+        return cls(message)
 
 
 class RepositoryError(CommandError):
@@ -133,6 +177,21 @@ class ConflictError(CommandError):
         super().__init__(message, exit_code=2)
 
 
+# Exception types that map straight onto a CommandError subclass (and exit code)
+_EXCEPTION_CATEGORIES: tuple[tuple[type[Exception], type[CommandError]], ...] = (
+    (PermissionError, ConflictError),
+    (FileExistsError, ConflictError),
+    (ValidationError, ConfigurationError),
+)
+
+# Message keywords that map any other exception onto a CommandError subclass
+_ERROR_CATEGORIES: tuple[tuple[tuple[str, ...], type[CommandError]], ...] = (
+    (("repository", "git", "clone", "fetch", "remote"), RepositoryError),
+    (("config", "toml", "validation", "invalid"), ConfigurationError),
+    (("conflict", "exists", "permission"), ConflictError),
+)
+
+
 def create_command_context(ctx_obj: CommandContext) -> CommandContext:
     """Return the already-initialized unified command context.
 
@@ -147,27 +206,34 @@ def create_command_context(ctx_obj: CommandContext) -> CommandContext:
     raise ConfigurationError("Internal error: command context not initialized")
 
 
-def ensure_repository_configured(context: CommandContext) -> None:
+def ensure_repository_configured(context: CommandContext) -> str:
     """Ensure repository is configured, raise error if not.
 
     Args:
         context: Command context to check
 
+    Returns:
+        The configured repository URL
+
     Raises:
         ConfigurationError: If no repository is configured
     """
-    if not context.config.is_configured():
+    repo_url = context.config.default_repo_url
+    if repo_url is None:
         raise ConfigurationError("No repository configured. Use 'c3cli config set repository.url <url>'")
+    return repo_url
 
 
 def handle_command_error(error: Exception) -> None:
     """Handle command errors with consistent formatting and exit codes."""
-    if isinstance(error, typer.Exit):
+    # Exits, aborted prompts (Ctrl-C/EOF at a confirm) and interpreter exits propagate untouched
+    if isinstance(error, (typer.Exit, typer.Abort, KeyboardInterrupt, SystemExit)):
         raise
 
     # Convert to CommandError if needed
     cmd_error = CommandError.from_exception(error)
-    console.print(f"[red]Error: {cmd_error.message}[/red]")
+    # Text skips markup parsing, so brackets in messages (paths, git output) print verbatim
+    console.print(Text(f"Error: {cmd_error.message}", style="red"))
     raise typer.Exit(cmd_error.exit_code)
 
 
@@ -189,7 +255,7 @@ def get_command_context() -> CommandContext:
 
 def sync_repo_if_needed(
     context: CommandContext,
-    git_ops,
+    git_ops: "GitOperations",
     *,
     branch: str | None = None,
     force: bool = False,
@@ -205,22 +271,110 @@ def sync_repo_if_needed(
         force: Force sync (discard local changes)
 
     Raises:
+        ConfigurationError: If no repository is configured
         RepositoryError: When clone/sync fails
     """
+    repo_url = ensure_repository_configured(context)
     repo_cache_dir = context.config.get_repo_cache_dir()
     sync_branch = branch if branch is not None else context.config.repo_branch
 
-    need_sync = (not repo_cache_dir.exists()) or context.config.should_auto_sync()
-    if not need_sync:
-        return
+    if context.repo_cache_stat is not None:
+        if context.no_sync or not context.config.should_auto_sync():
+            return
+
+        # The TTL only covers the branch that was synced; a branch switch always syncs
+        if not force and git_ops.is_on_branch(repo_cache_dir, sync_branch):
+            # A cache synced (or confirmed current) within the TTL is served as-is
+            age = git_ops.seconds_since_sync(repo_cache_dir)
+            if age is not None and age < context.config.sync_ttl:
+                return
+
+            # Skip the fetch entirely when the remote branch tip is what we already have
+            if git_ops.is_up_to_date(repo_cache_dir, repo_url, sync_branch):
+                git_ops.mark_synced(repo_cache_dir)
+                return
 
     if context.output_format == "text" and context.verbose:
-        console.print(f"Syncing repository from {context.config.default_repo_url}")
+        console.print(f"Syncing repository from {repo_url}")
 
     try:
-        git_ops.ensure_repo(context.config.default_repo_url, sync_branch, repo_cache_dir, force=force)
+        git_ops.ensure_repo(
+            repo_url,
+            sync_branch,
+            repo_cache_dir,
+            force=force,
+            shallow=context.config.shallow,
+        )
     except Exception as e:
         if isinstance(e, RepositoryError):
             raise
         logger.error(f"Repository sync failed: {e}")
         raise RepositoryError("Failed to prepare repository cache")
+
+    # Cached discovery results are keyed by HEAD; drop them once the cache moved
+    git_ops.clear_template_cache(context.config.get_template_cache_dir())
+    git_ops.mark_synced(repo_cache_dir)
+
+
+def discover_templates_for(
+    context: CommandContext, git_ops: "GitOperations", template_type: TemplateType | None = None
+) -> tuple[Template, ...]:
+    """Discover repository templates once per invocation and HEAD commit.
+
+    Results are memoized on the context and backed by the on-disk discovery
+    cache. The key includes the HEAD SHA, so a sync that moves the checkout
+    naturally misses and rediscovers.
+
+    Args:
+        context: Unified command context
+        git_ops: GitOperations instance
+        template_type: Optional TemplateType to restrict discovery
+
+    Returns:
+        Immutable tuple of discovered templates
+    """
+    repo_cache_dir = context.config.get_repo_cache_dir()
+    key = (git_ops.get_head_sha(repo_cache_dir), template_type)
+    templates = context.template_cache.get(key)
+    if templates is None:
+        templates = tuple(
+            git_ops.discover_templates_cached(repo_cache_dir, context.config.get_template_cache_dir(), template_type)
+        )
+        context.template_cache[key] = templates
+    return templates
+
+
+def run_install_script(args: list[str], cwd: Path, *, verbose: bool = False) -> None:
+    """Run an install script, streaming its output as it is produced.
+
+    In verbose mode stdout and stderr are merged and echoed line by line.
+    Otherwise stdout is discarded unread and only stderr is collected. Either
+    way only the last lines are kept in memory so they can be reported if the
+    script fails.
+
+    Args:
+        args: Command line to execute
+        cwd: Working directory for the script
+        verbose: Echo script output while it runs
+
+    Raises:
+        subprocess.CalledProcessError: If the script exits with a non-zero status
+    """
+    tail: deque[str] = deque(maxlen=_SCRIPT_OUTPUT_TAIL)
+    with subprocess.Popen(
+        args,
+        cwd=cwd,
+        text=True,
+        bufsize=1,
+        stdout=subprocess.PIPE if verbose else subprocess.DEVNULL,
+        stderr=subprocess.STDOUT if verbose else subprocess.PIPE,
+    ) as proc:
+        # The one piped stream: merged output in verbose mode, stderr otherwise
+        output = proc.stdout if verbose else proc.stderr
+        for line in output or ():
+            tail.append(line)
+            if verbose:
+                console.print(line, end="", markup=False, highlight=False)
+
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, args, stderr="".join(tail))
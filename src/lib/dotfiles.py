@@ -1,14 +1,26 @@
 """Dotfiles library for symlink management."""
 
+import os
+import stat
 import shutil
 import logging
 from pathlib import Path
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 
+from .fs_batch import probe_links
 from ..models.template import Template
 from ..models.dotfile_link import DotfileLink
 
 logger = logging.getLogger(__name__)
 
+# Below this many links the thread hand-off costs more than the symlink calls it overlaps
+_MIN_PARALLEL_LINKS = 8
+
+# Directories the symlink scans never descend into. Only names that cannot hold managed
+# dotfile links belong here; generic names like build/ or .cache/ may be link targets.
+_SKIPPED_DIRS = frozenset({".git", ".tox", ".venv", "venv", "__pycache__", "node_modules"})
+
 
 class DotfilesManager:
     """Manages dotfiles installation through symbolic links.
@@ -17,14 +29,16 @@ class DotfilesManager:
     from the user's home directory to files in configuration repositories.
     """
 
-    def __init__(self, user_home: Path | None = None):
+    def __init__(self, user_home: Path | None = None, max_workers: int = 4):
         """Initialize the dotfiles manager.
 
         Args:
             user_home: User's home directory. Defaults to current user's home.
+            max_workers: Maximum number of symlinks created concurrently
         """
         self.user_home = user_home or Path.home()
         self.logger = logger
+        self.max_workers = max_workers
 
     def install_template(
         self, template: Template, repository_path: Path, force: bool = False, dry_run: bool = False
@@ -50,12 +64,13 @@ class DotfilesManager:
         links_to_create = []
         created_links = []
 
-        # Plan all symlinks first
-        for file_path in template.files:
-            source = template_path / file_path
+        # Plan all symlinks first; source presence comes from one batched probe of the template
+        sources = [template_path / file_path for file_path in template.files]
+        probes = probe_links([os.fspath(source) for source in sources])
+        for file_path, source, (file_type, _) in zip(template.files, sources, probes, strict=True):
             target = self.user_home / file_path
 
-            if not source.exists():
+            if file_type is None:
                 self.logger.warning(f"Source file does not exist: {source}")
                 continue
 
@@ -68,10 +83,26 @@ class DotfilesManager:
                 self.logger.info(f"  {link.target} -> {link.source}")
             return True, links_to_create
 
-        # Create symlinks
+        # Create each distinct parent directory once; a failure surfaces per link below
+        for parent in dict.fromkeys(link.target.parent for link in links_to_create):
+            try:
+                os.makedirs(parent, exist_ok=True)
+            except OSError:
+                pass
+
+        # Create symlinks; each is an independent syscall, so larger templates overlap them in a small pool
+        def create(link: DotfileLink) -> bool:
+            return self._create_single_symlink(link, force, parent_ready=True)
+
+        if self.max_workers > 1 and len(links_to_create) > _MIN_PARALLEL_LINKS:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(links_to_create))) as executor:
+                results = list(executor.map(create, links_to_create))
+        else:
+            results = [create(link) for link in links_to_create]
+
         success = True
-        for link in links_to_create:
-            if self._create_single_symlink(link, force):
+        for link, created in zip(links_to_create, results, strict=True):
+            if created:
                 created_links.append(link)
             else:
                 success = False
@@ -79,43 +110,50 @@ class DotfilesManager:
         self.logger.info(f"Created {len(created_links)} symlinks for template {template.name}")
         return success, created_links
 
-    def _create_single_symlink(self, link: DotfileLink, force: bool = False) -> bool:
+    def _create_single_symlink(self, link: DotfileLink, force: bool = False, parent_ready: bool = False) -> bool:
         """Create a single symbolic link.
 
         Args:
             link: DotfileLink to create
             force: Whether to overwrite existing files
+            parent_ready: Skip creating the parent directory (the caller already did)
 
         Returns:
             True if successful, False otherwise
         """
+        target = os.fspath(link.target)
+        source = os.fspath(link.source)
         try:
-            # Check if we can create the symlink
-            can_create, reason = link.can_create_symlink()
-            if not can_create and not force:
-                self.logger.error(f"Cannot create symlink {link.target}: {reason}")
-                return False
-
-            # Remove existing file/link if force is enabled
-            if force and link.target.exists():
-                if link.target.is_symlink():
-                    link.target.unlink()
-                elif link.target.is_file():
-                    link.target.unlink()
-                elif link.target.is_dir():
-                    shutil.rmtree(link.target)
-
-            # Ensure parent directory exists
-            link.target.parent.mkdir(parents=True, exist_ok=True)
-
-            # Create the symlink
-            link.target.symlink_to(link.source)
-
-            self.logger.debug(f"Created symlink: {link.target} -> {link.source}")
+            # One lstat answers every "what is already there?" question
+            try:
+                mode = os.lstat(target).st_mode
+            except FileNotFoundError:
+                mode = None
+
+            if not force:
+                if mode is not None and not stat.S_ISLNK(mode):
+                    self.logger.error(f"Cannot create symlink {target}: Target file exists and is not a symlink")
+                    return False
+                if not os.path.exists(source):
+                    self.logger.error(f"Cannot create symlink {target}: Source file does not exist")
+                    return False
+            elif mode is not None:
+                # Remove existing file/link/directory
+                if stat.S_ISDIR(mode):
+                    shutil.rmtree(target)
+                else:
+                    os.unlink(target)
+
+            if not parent_ready:
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+
+            os.symlink(source, target)
+
+            self.logger.debug(f"Created symlink: {target} -> {source}")
             return True
 
         except (OSError, PermissionError) as e:
-            self.logger.error(f"Failed to create symlink {link.target}: {e}")
+            self.logger.error(f"Failed to create symlink {target}: {e}")
             return False
 
     def create_symlink(self, source: Path, target: Path, force: bool = False) -> bool:
@@ -158,9 +196,34 @@ class DotfilesManager:
 
         return links
 
+    def _iter_symlinks(self, root: Path) -> Iterator[str]:
+        """Yield the path of every symlink under root, skipping _SKIPPED_DIRS.
+
+        Walks with scandir, so entry types come from the directory listing and
+        plain files and directories cost no extra syscalls.
+        """
+        pending = [os.fspath(root)]
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except OSError as e:
+                self.logger.error(f"Error scanning directory {directory}: {e}")
+                continue
+
+            for entry in entries:
+                if entry.is_symlink():
+                    yield entry.path
+                elif entry.is_dir(follow_symlinks=False) and entry.name not in _SKIPPED_DIRS:
+                    pending.append(entry.path)
+
     def check_symlinks_status(self, target_directory: Path | None = None) -> list[dict]:
         """Check status of all symlinks in a directory.
 
+        VCS metadata, virtualenvs and dependency trees such as node_modules are
+        not descended into.
+
         Args:
             target_directory: Directory to check. Defaults to user home.
 
@@ -170,28 +233,32 @@ class DotfilesManager:
         if target_directory is None:
             target_directory = self.user_home
 
+        home_prefix = os.path.join(os.fspath(self.user_home), "")
         symlinks = []
 
-        try:
-            for item in target_directory.rglob("*"):
-                if item.is_symlink():
-                    # Try to calculate relative path, fallback to absolute path if not possible
-                    try:
-                        relative_path = str(item.relative_to(self.user_home))
-                    except ValueError:
-                        # Path is not relative to home directory (e.g., in tests)
-                        relative_path = str(item)
-
-                    status_info = {
-                        "target": str(item),
-                        "source": str(item.resolve()) if item.exists() else str(item.readlink()),
-                        "exists": item.exists(),
-                        "broken": item.is_symlink() and not item.exists(),
-                        "relative_to_home": relative_path,
-                    }
-                    symlinks.append(status_info)
-        except (OSError, PermissionError) as e:
-            self.logger.error(f"Error scanning directory {target_directory}: {e}")
+        for path in self._iter_symlinks(target_directory):
+            # Path is not relative to home directory (e.g., in tests): fall back to absolute path
+            relative_path = path[len(home_prefix) :] if path.startswith(home_prefix) else path
+            try:
+                os.stat(path)
+                exists = True
+                source = os.path.realpath(path)
+            except OSError:
+                exists = False
+                try:
+                    source = os.readlink(path)
+                except OSError:
+                    continue
+
+            symlinks.append(
+                {
+                    "target": path,
+                    "source": source,
+                    "exists": exists,
+                    "broken": not exists,
+                    "relative_to_home": relative_path,
+                }
+            )
 
         return symlinks
 
@@ -211,26 +278,27 @@ class DotfilesManager:
         if not template.is_dotfiles_template():
             return True, 0
 
-        links = self.verify_template_links(template, repository_path)
+        # Only "is there a link to remove?" matters here, so skip full verification: one lstat per target
+        link_targets = [
+            target for target, _ in self.expected_link_paths(template, repository_path) if os.path.islink(target)
+        ]
         removed_count = 0
         success = True
 
         if dry_run:
-            valid_links = [link for link in links if link.is_symlink()]
-            self.logger.info(f"DRY RUN: Would remove {len(valid_links)} symlinks for template {template.name}")
-            for link in valid_links:
-                self.logger.info(f"  {link.target}")
-            return True, len(valid_links)
-
-        for link in links:
-            if link.is_symlink():
-                try:
-                    link.target.unlink()
-                    removed_count += 1
-                    self.logger.debug(f"Removed symlink: {link.target}")
-                except (OSError, PermissionError) as e:
-                    self.logger.error(f"Failed to remove symlink {link.target}: {e}")
-                    success = False
+            self.logger.info(f"DRY RUN: Would remove {len(link_targets)} symlinks for template {template.name}")
+            for target in link_targets:
+                self.logger.info(f"  {target}")
+            return True, len(link_targets)
+
+        for target in link_targets:
+            try:
+                os.unlink(target)
+                removed_count += 1
+                self.logger.debug(f"Removed symlink: {target}")
+            except (OSError, PermissionError) as e:
+                self.logger.error(f"Failed to remove symlink {target}: {e}")
+                success = False
 
         self.logger.info(f"Removed {removed_count} symlinks for template {template.name}")
         return success, removed_count
@@ -250,26 +318,24 @@ class DotfilesManager:
         if not dotfiles_dir.exists():
             return installed
 
-        # Find all potential templates by looking for symlinks that point into the repository
-        for item in self.user_home.rglob("*"):
-            if item.is_symlink():
-                try:
-                    source = item.resolve()
-                    if source.is_relative_to(dotfiles_dir):
-                        # Determine which template this belongs to
-                        rel_path = source.relative_to(dotfiles_dir)
-                        template_name = rel_path.parts[0] if rel_path.parts else "unknown"
-
-                        if template_name not in installed:
-                            installed[template_name] = []
+        # Find all potential templates by looking for symlinks that point into the repository.
+        # install links straight to the repository file, so one readlink hop is enough.
+        dotfiles_prefix = os.path.join(os.fspath(dotfiles_dir), "")
+        for path in self._iter_symlinks(self.user_home):
+            try:
+                source = os.path.normpath(os.path.join(os.path.dirname(path), os.readlink(path)))
+                if not source.startswith(dotfiles_prefix):
+                    continue
 
-                        link = DotfileLink(source=source, target=item, template_name=template_name)
-                        link.verify_link()
-                        installed[template_name].append(link)
+                # Determine which template this belongs to
+                template_name = source[len(dotfiles_prefix) :].split(os.sep, 1)[0]
+                link = DotfileLink(source=Path(source), target=Path(path), template_name=template_name)
+                link.verify_link()
+                installed.setdefault(template_name, []).append(link)
 
-                except (OSError, ValueError):
-                    # Skip broken or invalid symlinks
-                    continue
+            except (OSError, ValueError):
+                # Skip unreadable or invalid symlinks
+                continue
 
         return installed
 
@@ -293,3 +359,22 @@ class DotfilesManager:
             links.append(link)
 
         return links
+
+    def expected_link_paths(self, template: Template, repository_path: Path) -> list[tuple[str, str]]:
+        """Get expected symlink locations for a template as plain strings.
+
+        A lightweight form of expected_symlinks_for_template for read-only
+        checks that only need the paths, not full DotfileLink models.
+
+        Args:
+            template: Template to get symlinks for
+            repository_path: Path to the repository
+
+        Returns:
+            List of (target, source) path strings
+        """
+        template_path = os.path.join(repository_path, "dotfiles", template.name)
+        user_home = os.fspath(self.user_home)
+        return [
+            (os.path.join(user_home, file_path), os.path.join(template_path, file_path)) for file_path in template.files
+        ]
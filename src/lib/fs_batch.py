@@ -0,0 +1,106 @@
+"""Batched filesystem probes for commands that inspect many paths at once."""
+
+import os
+import stat
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+# Below this many paths the thread hand-off costs more than the syscalls it overlaps
+_MIN_PARALLEL_PATHS = 64
+
+# Directories expected to hold at least this many of the paths are listed once instead of
+# stat'ed per path; below it a listing of a busy directory like $HOME costs more than it saves
+_MIN_SCANDIR_PATHS = 8
+
+# (file type bits, raw symlink text): type is None for missing paths, text only set for symlinks
+LinkProbe = tuple[int | None, str | None]
+
+
+def _probe(path: str) -> LinkProbe:
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return None, None
+    if not stat.S_ISLNK(mode):
+        return stat.S_IFMT(mode), None
+    try:
+        return stat.S_IFLNK, os.readlink(path)
+    except OSError:
+        # Replaced between the lstat and the readlink; report it as a non-link entry
+        return stat.S_IFLNK, None
+
+
+def _probe_chunk(paths: list[str]) -> list[LinkProbe]:
+    return [_probe(path) for path in paths]
+
+
+def _probe_entry(entry: os.DirEntry[str] | None) -> LinkProbe:
+    # DirEntry file types come from the directory listing itself, so only links cost a syscall
+    if entry is None:
+        return None, None
+    if entry.is_symlink():
+        try:
+            return stat.S_IFLNK, os.readlink(entry.path)
+        except OSError:
+            return stat.S_IFLNK, None
+    if entry.is_dir(follow_symlinks=False):
+        return stat.S_IFDIR, None
+    if entry.is_file(follow_symlinks=False):
+        return stat.S_IFREG, None
+    return _probe(entry.path)
+
+
+def _probe_directory(parent: str, names: list[str]) -> list[LinkProbe]:
+    try:
+        with os.scandir(parent) as it:
+            entries = {entry.name: entry for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return [(None, None)] * len(names)
+    except OSError:
+        return _probe_chunk([os.path.join(parent, name) for name in names])
+    return [_probe_entry(entries.get(name)) for name in names]
+
+
+def probe_links(paths: list[str], max_workers: int = 4) -> list[LinkProbe]:
+    """Stat every path without following links and read the symlinks among them, in order.
+
+    Paths sharing a parent directory with many others are answered from a
+    single listing of that directory. The rest are stat'ed individually;
+    large batches of those are split into one contiguous chunk per worker
+    so the blocking syscalls overlap without paying a future per path.
+
+    Args:
+        paths: Paths to probe
+        max_workers: Maximum number of threads issuing syscalls
+
+    Returns:
+        One (file type, link text) probe per path
+    """
+    by_parent: defaultdict[str, list[int]] = defaultdict(list)
+    for index, path in enumerate(paths):
+        by_parent[os.path.dirname(path)].append(index)
+
+    # Filled per path below; every index is written exactly once
+    probes: dict[int, LinkProbe] = {}
+    rest: list[int] = []
+    for parent, indexes in by_parent.items():
+        if len(indexes) < _MIN_SCANDIR_PATHS:
+            rest.extend(indexes)
+            continue
+        names = [os.path.basename(paths[index]) for index in indexes]
+        for index, probe in zip(indexes, _probe_directory(parent, names), strict=True):
+            probes[index] = probe
+
+    rest_paths = [paths[index] for index in rest]
+    workers = min(max_workers, len(rest_paths) // _MIN_PARALLEL_PATHS)
+    if workers <= 1:
+        rest_probes = _probe_chunk(rest_paths)
+    else:
+        size = -(-len(rest_paths) // workers)
+        chunks = [rest_paths[i : i + size] for i in range(0, len(rest_paths), size)]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            rest_probes = [probe for chunk in executor.map(_probe_chunk, chunks) for probe in chunk]
+
+    for index, probe in zip(rest, rest_probes, strict=True):
+        probes[index] = probe
+    return [probes[index] for index in range(len(paths))]
@@ -1,9 +1,16 @@
 """Git operations library for repository management."""
 
+import os
+import json
+import time
+import shlex
 import shutil
 import logging
+import subprocess
 from pathlib import Path
 from datetime import datetime
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 
 import tomllib
 from git import Repo, GitCommandError, InvalidGitRepositoryError
@@ -14,6 +21,43 @@ from ..models.template import Template, TemplateType
 
 logger = logging.getLogger(__name__)
 
+TEMPLATE_CACHE_PREFIX = "template-cache-"
+# Bump when the cached payload changes shape or ordering
+_TEMPLATE_CACHE_VERSION = 2
+SYNC_SENTINEL = "c3-last-sync"
+
+# Template directories discovered concurrently once a type has at least this many
+_MIN_PARALLEL_TEMPLATES = 4
+_MAX_DISCOVERY_WORKERS = 8
+
+# Directory holding each template type inside a config repository
+_TEMPLATE_DIRS = {TemplateType.DOTFILES: "dotfiles", TemplateType.PROJECT: "projects"}
+
+
+def _iter_files(root: Path) -> Iterator[os.DirEntry[str]]:
+    """Yield every file under root, depth-first in directory listing order.
+
+    Matches Path.rglob("*") filtered by is_file(): symlinked files count,
+    symlinked directories are not descended into and unreadable
+    directories are skipped. Entry types come from the directory listing,
+    so regular files need no stat.
+    """
+    pending = [os.fspath(root)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
+            if entry.is_file():
+                yield entry
+            elif entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+        pending.extend(reversed(subdirs))
+
 
 class GitOperationError(Exception):
     """Custom exception for Git operation errors."""
@@ -32,13 +76,16 @@ class GitOperations:
         """Initialize Git operations manager."""
         self.logger = logger
 
-    def clone_repository(self, repo_url: str, local_path: str | Path, branch: str = "main") -> bool:
+    def clone_repository(
+        self, repo_url: str, local_path: str | Path, branch: str = "main", shallow: bool = False
+    ) -> bool:
         """Clone a Git repository to local path.
 
         Args:
             repo_url: Git repository URL
             local_path: Local directory to clone to
             branch: Branch to checkout
+            shallow: Clone only the tip commit of the branch, without tags
 
         Returns:
             True if successful, False otherwise
@@ -57,7 +104,10 @@ class GitOperations:
 
             # Clone the repository
             self.logger.info(f"Cloning repository {repo_url} to {local_path}")
-            _ = Repo.clone_from(repo_url, local_path, branch=branch)
+            if shallow:
+                _ = Repo.clone_from(repo_url, local_path, branch=branch, depth=1, single_branch=True, no_tags=True)
+            else:
+                _ = Repo.clone_from(repo_url, local_path, branch=branch)
 
             self.logger.info(f"Successfully cloned repository to {local_path}")
             return True
@@ -69,7 +119,37 @@ class GitOperations:
             self.logger.error(f"Unexpected error while cloning {repo_url}: {e}")
             return False
 
-    def ensure_repo(self, repo_url: str, branch: str, cache_dir: Path, force: bool = False) -> Path:
+    def clone_many(
+        self, specs: list[tuple[str, str | Path, str]], max_workers: int = 4, shallow: bool = False
+    ) -> dict[str, bool]:
+        """Clone several repositories concurrently.
+
+        Clones are network-bound and git runs as a subprocess, so threads
+        overlap them; the default worker cap keeps the request rate to the
+        hosting service modest.
+
+        Args:
+            specs: (repository URL, local path, branch) per clone; local paths must be distinct
+            max_workers: Maximum number of concurrent clones
+            shallow: Clone only the tip commit of each branch, without tags
+
+        Returns:
+            Clone success keyed by local path
+        """
+        if not specs:
+            return {}
+
+        def clone(spec: tuple[str, str | Path, str]) -> bool:
+            repo_url, local_path, branch = spec
+            return self.clone_repository(repo_url, local_path, branch=branch, shallow=shallow)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(specs)))) as executor:
+            results = list(executor.map(clone, specs))
+        return {str(local_path): ok for (_, local_path, _), ok in zip(specs, results, strict=True)}
+
+    def ensure_repo(
+        self, repo_url: str, branch: str, cache_dir: Path, force: bool = False, shallow: bool = False
+    ) -> Path:
         """Ensure repository is available locally, clone if missing, sync if exists.
 
         This eliminates the if/else branch pattern across all CLI commands.
@@ -79,6 +159,7 @@ class GitOperations:
             branch: Branch to sync
             cache_dir: Local cache directory path
             force: Force sync, overwriting local changes
+            shallow: Keep only the tip commit of the branch
 
         Returns:
             Path to the local repository
@@ -88,24 +169,27 @@ class GitOperations:
         """
         if not cache_dir.exists():
             # Clone repository
-            success = self.clone_repository(repo_url, cache_dir, branch)
+            success = self.clone_repository(repo_url, cache_dir, branch, shallow=shallow)
             if not success:
                 raise RepositoryError("Failed to clone repository")
         else:
             # Sync existing repository
-            success = self.sync_repository(cache_dir, branch, force=force)
+            success = self.sync_repository(cache_dir, branch, force=force, shallow=shallow)
             if not success:
                 raise RepositoryError("Failed to sync repository")
 
         return cache_dir
 
-    def sync_repository(self, local_path: Path, branch: str | None = None, force: bool = False) -> bool:
+    def sync_repository(
+        self, local_path: Path, branch: str | None = None, force: bool = False, shallow: bool = False
+    ) -> bool:
         """Sync local repository with remote.
 
         Args:
             local_path: Path to local repository
             branch: Branch to sync (defaults to current branch)
             force: If True, reset local changes to match remote
+            shallow: Fetch only the tip commit of the branch
 
         Returns:
             True if successful, False otherwise
@@ -117,6 +201,9 @@ class GitOperations:
 
             repo = Repo(local_path)
 
+            if shallow:
+                return self._sync_shallow(repo, branch or repo.active_branch.name, force)
+
             # Switch to specified branch if provided
             if branch and repo.active_branch.name != branch:
                 try:
@@ -135,13 +222,13 @@ class GitOperations:
             origin.fetch()
 
             # Handle local changes based on force option
+            current_branch = repo.active_branch.name
             if force:
                 # Reset to match remote (discards local changes)
-                current_branch = repo.active_branch.name
                 repo.git.reset("--hard", f"origin/{current_branch}")
             else:
-                # Try to pull changes (may fail if conflicts exist)
-                origin.pull()
+                # Merge what was just fetched (may fail if conflicts exist); a pull would fetch again
+                repo.git.merge(f"origin/{current_branch}")
 
             self.logger.info("Successfully synced repository")
             return True
@@ -156,6 +243,38 @@ class GitOperations:
             self.logger.error(f"Unexpected error while syncing: {e}")
             return False
 
+    def _sync_shallow(self, repo: Repo, branch: str, force: bool) -> bool:
+        """Move the local branch to the remote branch tip without fetching history.
+
+        Args:
+            repo: Local repository
+            branch: Branch to sync
+            force: If True, discard local changes
+
+        Returns:
+            True if successful
+
+        Raises:
+            GitCommandError: If fetch or checkout fails
+        """
+        self.logger.info(f"Syncing repository at {repo.working_tree_dir} (shallow)")
+
+        # Chain fetch and checkout in one shell to pay process startup only once.
+        # checkout -B both switches and fast-forwards, keeping non-conflicting local edits
+        quoted_branch = shlex.quote(branch)
+        checkout_flags = "-f -B" if force else "-B"
+        script = (
+            f"git fetch --depth=1 --no-tags origin {quoted_branch} && "
+            f"git checkout {checkout_flags} {quoted_branch} FETCH_HEAD"
+        )
+        command = ["sh", "-c", script]
+        result = subprocess.run(command, cwd=repo.working_tree_dir, check=False, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise GitCommandError(command, result.returncode, result.stderr)
+
+        self.logger.info("Successfully synced repository")
+        return True
+
     def get_repository_status(self, local_path: Path) -> dict | None:
         """Get status information about a Git repository.
 
@@ -171,33 +290,48 @@ class GitOperations:
 
             repo = Repo(local_path)
 
-            # Get basic info
+            # One porcelain status answers branch, dirtiness, untracked files and ahead/behind
+            branch = None
+            ahead_behind = None
+            is_dirty = False
+            untracked_files = []
+            records = iter(repo.git.status("--porcelain=v2", "--branch", "--untracked-files=all", "-z").split("\0"))
+            for record in records:
+                if record.startswith("# branch.head "):
+                    branch = record[len("# branch.head ") :]
+                elif record.startswith("# branch.ab "):
+                    ahead, behind = record[len("# branch.ab ") :].split()
+                    ahead_behind = (int(ahead), -int(behind))
+                elif record.startswith("? "):
+                    untracked_files.append(record[2:])
+                elif record.startswith("2 "):
+                    # Renames and copies carry their original path as an extra record
+                    is_dirty = True
+                    next(records, None)
+                elif record.startswith(("1 ", "u ")):
+                    is_dirty = True
+
+            if branch is None or branch == "(detached)":
+                raise ValueError("HEAD is detached")
+
+            head_commit = repo.head.commit
             status = {
                 "path": str(local_path),
-                "branch": repo.active_branch.name,
+                "branch": branch,
                 "remote_url": repo.remotes.origin.url if repo.remotes else None,
                 "last_commit": {
-                    "hash": repo.head.commit.hexsha,
-                    "message": repo.head.commit.message.strip(),
-                    "author": str(repo.head.commit.author),
-                    "date": datetime.fromtimestamp(repo.head.commit.committed_date).isoformat(),
+                    "hash": head_commit.hexsha,
+                    "message": head_commit.message.strip(),
+                    "author": str(head_commit.author),
+                    "date": datetime.fromtimestamp(head_commit.committed_date).isoformat(),
                 },
-                "is_dirty": repo.is_dirty(),
-                "untracked_files": repo.untracked_files,
+                "is_dirty": is_dirty,
+                "untracked_files": untracked_files,
             }
 
-            # Check if remote tracking branch exists and get ahead/behind info
-            try:
-                tracking_branch = repo.active_branch.tracking_branch()
-                if tracking_branch:
-                    ahead, behind = repo.git.rev_list(
-                        "--count", "--left-right", f"{tracking_branch}...{repo.active_branch}"
-                    ).split("\t")
-                    status["ahead"] = int(ahead)
-                    status["behind"] = int(behind)
-            except (GitCommandError, AttributeError):
-                status["ahead"] = 0
-                status["behind"] = 0
+            # Only branches with an upstream report ahead/behind
+            if ahead_behind is not None:
+                status["ahead"], status["behind"] = ahead_behind
 
             return status
 
@@ -205,14 +339,17 @@ class GitOperations:
             self.logger.error(f"Error getting repository status: {e}")
             return None
 
-    def discover_templates(self, repository_path: Path | str) -> list[Template]:
+    def discover_templates(
+        self, repository_path: Path | str, template_type: TemplateType | None = None
+    ) -> list[Template]:
         """Discover all templates in a repository.
 
         Args:
             repository_path: Path to the cloned repository
+            template_type: Optional TemplateType; other template directories are not walked
 
         Returns:
-            List of discovered Template objects
+            List of discovered Template objects, dotfiles first, each type sorted by name
         """
         # Convert to Path object if needed
         if isinstance(repository_path, str):
@@ -220,31 +357,217 @@ class GitOperations:
 
         templates = []
 
-        # Discover dotfiles templates
-        dotfiles_dir = repository_path / "dotfiles"
-        if dotfiles_dir.exists():
-            templates.extend(self._discover_templates_in_directory(dotfiles_dir, TemplateType.DOTFILES))
-
-        # Discover project templates
-        projects_dir = repository_path / "projects"
-        if projects_dir.exists():
-            templates.extend(self._discover_templates_in_directory(projects_dir, TemplateType.PROJECT))
+        # Dotfiles first, then projects; get_template_by_name lets the later type win a name collision
+        for candidate_type, dir_name in _TEMPLATE_DIRS.items():
+            base_dir = repository_path / dir_name
+            if template_type in (None, candidate_type) and base_dir.exists():
+                templates.extend(self._discover_templates_in_directory(base_dir, candidate_type))
 
         self.logger.info(f"Discovered {len(templates)} templates in repository")
         return templates
 
+    def discover_templates_cached(
+        self, repository_path: Path | str, cache_dir: Path, template_type: TemplateType | None = None
+    ) -> list[Template]:
+        """Discover templates, reusing a sidecar cache keyed by the repository HEAD commit.
+
+        The cache file is only trusted when it was written for the same repository
+        path and HEAD commit; otherwise the repository is walked and the cache rewritten.
+
+        Args:
+            repository_path: Path to the cloned repository
+            cache_dir: Directory holding template cache files
+            template_type: Optional TemplateType to restrict discovery
+
+        Returns:
+            List of discovered Template objects
+        """
+        if isinstance(repository_path, str):
+            repository_path = Path(repository_path)
+
+        head_sha = self.get_head_sha(repository_path)
+        if head_sha is None:
+            return self.discover_templates(repository_path, template_type)
+
+        suffix = f"-{template_type.value}" if template_type is not None else ""
+        cache_file = cache_dir / f"{TEMPLATE_CACHE_PREFIX}{head_sha}{suffix}.json"
+        try:
+            data = json.loads(cache_file.read_text())
+            if data.get("version") == _TEMPLATE_CACHE_VERSION and data.get("repository") == str(repository_path):
+                return [Template.model_validate(item) for item in data["templates"]]
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, ValidationError) as e:
+            self.logger.warning(f"Ignoring unreadable template cache {cache_file}: {e}")
+
+        templates = self.discover_templates(repository_path, template_type)
+
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            payload = {
+                "version": _TEMPLATE_CACHE_VERSION,
+                "repository": str(repository_path),
+                "templates": [t.model_dump(mode="json") for t in templates],
+            }
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            tmp_file.write_text(json.dumps(payload))
+            os.replace(tmp_file, cache_file)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning(f"Failed to write template cache {cache_file}: {e}")
+
+        return templates
+
+    def clear_template_cache(self, cache_dir: Path) -> None:
+        """Remove all template cache files from cache directory.
+
+        Args:
+            cache_dir: Directory holding template cache files
+        """
+        if not cache_dir.exists():
+            return
+
+        for cache_file in cache_dir.glob(f"{TEMPLATE_CACHE_PREFIX}*.json"):
+            try:
+                cache_file.unlink()
+            except OSError as e:
+                self.logger.warning(f"Failed to remove template cache {cache_file}: {e}")
+
+    def get_head_sha(self, repository_path: Path) -> str | None:
+        """Read the HEAD commit SHA directly from the repository metadata.
+
+        Args:
+            repository_path: Path to local repository
+
+        Returns:
+            HEAD commit SHA, None if it cannot be determined
+        """
+        git_dir = repository_path / ".git"
+        try:
+            head = (git_dir / "HEAD").read_text().strip()
+            if not head.startswith("ref: "):
+                return head or None
+
+            ref = head[len("ref: ") :]
+            ref_file = git_dir / ref
+            if ref_file.exists():
+                return ref_file.read_text().strip() or None
+
+            packed_refs = git_dir / "packed-refs"
+            if packed_refs.exists():
+                for line in packed_refs.read_text().splitlines():
+                    if line.endswith(f" {ref}"):
+                        return line.split(" ", 1)[0]
+        except OSError:
+            pass
+
+        return None
+
+    def get_remote_sha(self, repo_url: str, branch: str) -> str | None:
+        """Look up the commit SHA of a remote branch without fetching any objects.
+
+        Args:
+            repo_url: Git repository URL
+            branch: Branch name
+
+        Returns:
+            Remote branch SHA, None if the branch is missing or the remote unreachable
+        """
+        try:
+            result = subprocess.run(
+                ["git", "ls-remote", "--quiet", repo_url, f"refs/heads/{branch}"],
+                check=False,
+                capture_output=True,
+                text=True,
+                timeout=30,
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            self.logger.debug(f"ls-remote failed for {repo_url}: {e}")
+            return None
+
+        if result.returncode != 0 or not result.stdout:
+            return None
+        return result.stdout.split(maxsplit=1)[0]
+
+    def is_up_to_date(self, local_path: Path, repo_url: str, branch: str) -> bool:
+        """Check whether a local checkout already matches the remote branch tip.
+
+        Only the ref advertisement is requested from the remote, so this is far
+        cheaper than a fetch when nothing changed.
+
+        Args:
+            local_path: Path to local repository
+            repo_url: Git repository URL
+            branch: Branch that should be checked out
+
+        Returns:
+            True if the branch is checked out at the remote SHA
+        """
+        if not self.is_on_branch(local_path, branch):
+            return False
+
+        local_sha = self.get_head_sha(local_path)
+        return local_sha is not None and local_sha == self.get_remote_sha(repo_url, branch)
+
+    def is_on_branch(self, local_path: Path, branch: str) -> bool:
+        """Check whether a local checkout has the given branch checked out.
+
+        Args:
+            local_path: Path to local repository
+            branch: Branch name
+
+        Returns:
+            True if HEAD points at the branch
+        """
+        try:
+            head = (local_path / ".git" / "HEAD").read_text().strip()
+        except OSError:
+            return False
+        return head == f"ref: refs/heads/{branch}"
+
+    def mark_synced(self, local_path: Path) -> None:
+        """Record the time of the last successful sync check for a repository.
+
+        Args:
+            local_path: Path to local repository
+        """
+        try:
+            (local_path / ".git" / SYNC_SENTINEL).touch()
+        except OSError as e:
+            self.logger.debug(f"Could not update sync sentinel in {local_path}: {e}")
+
+    def seconds_since_sync(self, local_path: Path) -> float | None:
+        """Return how long ago the repository was last synced or confirmed current.
+
+        Args:
+            local_path: Path to local repository
+
+        Returns:
+            Age of the sync sentinel in seconds, None if it was never written
+        """
+        try:
+            return time.time() - (local_path / ".git" / SYNC_SENTINEL).stat().st_mtime
+        except OSError:
+            return None
+
     def get_template_by_name(
         self,
         repository_path: Path | str,
         name: str,
         template_type: TemplateType | None = None,
+        cache_dir: Path | None = None,
     ) -> Template:
         """Discover and return a template by name, optionally filtered by type.
 
+        The template directory is probed directly first; the repository is only
+        scanned when the name is not found there. Without a type filter, a name
+        present as both a dotfiles and a project template resolves to the
+        project one, the last match in discovery order.
+
         Args:
             repository_path: Path to the cloned repository
             name: Template name to find
             template_type: Optional TemplateType to restrict search
+            cache_dir: Optional template cache directory to reuse discovery results
 
         Returns:
             Template instance when found
@@ -254,16 +577,28 @@ class GitOperations:
         """
         from .command_base import ConfigurationError
 
-        templates = self.discover_templates(repository_path)
-        if template_type is not None:
-            if template_type == TemplateType.DOTFILES:
-                templates = [t for t in templates if t.is_dotfiles_template()]
-            elif template_type == TemplateType.PROJECT:
-                templates = [t for t in templates if t.is_project_template()]
+        if isinstance(repository_path, str):
+            repository_path = Path(repository_path)
 
-        by_name = {t.name: t for t in templates}
-        if name in by_name:
-            return by_name[name]
+        # Only plain directory names can be probed; anything else goes through discovery
+        if name and "/" not in name and os.sep not in name and not name.startswith("."):
+            # Probe in reverse discovery order so a name present under both types resolves to the last match
+            types = [template_type] if template_type is not None else list(reversed(_TEMPLATE_DIRS))
+            for candidate_type in types:
+                template_dir = repository_path / _TEMPLATE_DIRS[candidate_type] / name
+                if template_dir.is_dir():
+                    template = self._create_template_from_directory(template_dir, candidate_type)
+                    if template:
+                        return template
+
+        if cache_dir is not None:
+            templates = self.discover_templates_cached(repository_path, cache_dir, template_type)
+        else:
+            templates = self.discover_templates(repository_path, template_type)
+
+        for template in reversed(templates):
+            if template.name == name:
+                return template
 
         raise ConfigurationError(f"Template '{name}' not found")
 
@@ -277,17 +612,26 @@ class GitOperations:
         Returns:
             List of Template objects
         """
-        templates = []
-
         try:
-            for item in base_dir.iterdir():
-                if item.is_dir() and not item.name.startswith("."):
-                    template = self._create_template_from_directory(item, template_type)
-                    if template:
-                        templates.append(template)
+            with os.scandir(base_dir) as it:
+                candidates = [Path(entry.path) for entry in it if entry.is_dir() and not entry.name.startswith(".")]
         except (OSError, PermissionError) as e:
             self.logger.error(f"Error scanning directory {base_dir}: {e}")
+            candidates = []
 
+        # Each template is an independent walk plus metadata read, so overlap larger sets in a small pool
+        def create(template_dir: Path) -> Template | None:
+            return self._create_template_from_directory(template_dir, template_type)
+
+        if len(candidates) >= _MIN_PARALLEL_TEMPLATES:
+            with ThreadPoolExecutor(max_workers=min(_MAX_DISCOVERY_WORKERS, len(candidates))) as executor:
+                results = list(executor.map(create, candidates))
+        else:
+            results = [create(template_dir) for template_dir in candidates]
+        templates = [template for template in results if template]
+
+        # Sorted once here so renderers and cached results can iterate in order
+        templates.sort(key=lambda t: t.name)
         return templates
 
     def _create_template_from_directory(self, template_dir: Path, template_type: TemplateType) -> Template | None:
@@ -306,15 +650,18 @@ class GitOperations:
             # Find all files in template (excluding metadata and install script)
             files = []
             install_script = None
+            metadata_file = None
 
-            for item in template_dir.rglob("*"):
-                if item.is_file():
-                    rel_path = item.relative_to(template_dir)
+            prefix_len = len(os.path.join(os.fspath(template_dir), ""))
+            for entry in _iter_files(template_dir):
+                rel_path = entry.path[prefix_len:]
 
-                    if rel_path.name == "install.sh":
-                        install_script = str(rel_path)
-                    elif rel_path.name != "metadata.toml":
-                        files.append(str(rel_path))
+                if entry.name == "install.sh":
+                    install_script = rel_path
+                elif entry.name != "metadata.toml":
+                    files.append(rel_path)
+                elif rel_path == "metadata.toml":
+                    metadata_file = entry.path
 
             if not files:
                 self.logger.debug(f"Skipping empty template directory: {template_dir}")
@@ -324,8 +671,8 @@ class GitOperations:
             metadata = {}
             description = f"Template {template_name}"
 
-            metadata_file = template_dir / "metadata.toml"
-            if metadata_file.exists():
+            # The walk above already saw whether metadata.toml exists, so no extra stat is needed
+            if metadata_file is not None:
                 try:
                     with open(metadata_file, "rb") as f:
                         metadata = tomllib.load(f)
@@ -363,11 +710,19 @@ class GitOperations:
         Returns:
             True if valid Git repository, False otherwise
         """
-        try:
-            repo = Repo(path)
-            return not repo.bare
-        except (InvalidGitRepositoryError, GitCommandError):
-            return False
+        # A work tree has a .git directory, or a .git file pointing at one (linked worktrees,
+        # submodules); bare repositories have neither. Checked on disk rather than through Repo().
+        git_path = os.path.join(path, ".git")
+        if not os.path.isdir(git_path):
+            try:
+                with open(git_path, encoding="utf-8") as f:
+                    pointer = f.readline().strip()
+            except OSError:
+                return False
+            if not pointer.startswith("gitdir:"):
+                return False
+            git_path = os.path.join(path, pointer[len("gitdir:") :].strip())
+        return os.path.isfile(os.path.join(git_path, "HEAD"))
 
     def get_remote_branches(self, repository_path: Path) -> list[str]:
         """Get list of remote branches.
@@ -428,7 +783,7 @@ class GitOperations:
                     for item in template_dir.iterdir():
                         if item.is_dir() and not item.name.startswith("."):
                             # Check if template has any files
-                            has_files = any(f.is_file() for f in item.rglob("*"))
+                            has_files = next(_iter_files(item), None) is not None
                             if not has_files:
                                 issues.append(f"Empty template directory: {item.relative_to(repository_path)}")
                 except (OSError, PermissionError):
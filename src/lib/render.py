@@ -1,7 +1,7 @@
 """Lightweight rendering utilities for CLI output.
 
 KISS: only two helpers exposed to keep a single output pathway.
- - render_json(data): user-visible JSON output via rich Console
+ - render_json(data): user-visible JSON output on the console stream
  - render_text_status(...): text view for status command
 """
 
@@ -10,11 +10,22 @@ from __future__ import annotations
 import json
 from typing import Any
 from pathlib import Path
+from collections.abc import Sequence
 
-from rich.table import Table
+from rich.text import Text
 from rich.console import Console
 
-console = Console()
+from ..models.template import TemplateType
+from ..models.status_report import TemplateStatus
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # optional speedup, see the "speedups" extra
+    _HAS_ORJSON = False
+
+console = Console(highlight=False)
 
 
 def render_json(data: Any) -> None:
@@ -22,12 +33,20 @@ def render_json(data: Any) -> None:
 
     Keeps one place to control formatting/highlighting.
     """
-    # Avoid rich.print_json to prevent color codes in captured outputs when piping.
-    console.print(json.dumps(data, indent=2, default=str))
+    # JSON is data: write it straight to the console's stream, bypassing Rich's segment rendering
+    # (and any chance of markup, highlighting or wrapping touching it)
+    out = console.file
+    if _HAS_ORJSON:
+        options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        out.write(orjson.dumps(data, default=str, option=options).decode())
+    else:
+        json.dump(data, out, indent=2, default=str)
+        out.write("\n")
+    out.flush()
 
 
 def render_text_status(
-    status_data: list[dict[str, Any]],
+    status_data: list[TemplateStatus],
     repo_url: str | None,
     repo_cache_dir: Path,
     *,
@@ -36,7 +55,7 @@ def render_text_status(
     """Render status information in text mode.
 
     Parameters
-    - status_data: list of template status dicts with installed/broken/missing
+    - status_data: list of TemplateStatus records with installed/broken/missing links
     - repo_url: configured repository url
     - repo_cache_dir: local cache path
     - verbose: show details
@@ -54,79 +73,92 @@ def render_text_status(
         return
 
     for template_status in status_data:
-        name = template_status.get("name", "")
-        description = template_status.get("description", "")
-        installed = len(template_status.get("installed_links", []))
-        broken = len(template_status.get("broken_links", []))
-        missing = len(template_status.get("missing_links", []))
+        installed = len(template_status.installed_links)
+        broken = len(template_status.broken_links)
+        missing = len(template_status.missing_links)
 
         total = installed + broken + missing
-        console.print(f"\n[bold cyan]{name}[/bold cyan] - {description}")
+        # One render per template; Text segments skip markup parsing of names and paths
+        lines = [Text.assemble("\n", (template_status.name, "bold cyan"), f" - {template_status.description}")]
 
         if total == 0:
-            console.print("  [yellow]No files to link[/yellow]")
+            lines.append(Text("  No files to link", style="yellow"))
+            console.print(Text("\n").join(lines))
             continue
 
         status_color = "green" if broken == 0 and missing == 0 else ("yellow" if broken == 0 else "red")
-        console.print(f"  [{status_color}]{installed}/{total} links active[/{status_color}]")
+        lines.append(Text(f"  {installed}/{total} links active", style=status_color))
 
         if verbose or broken > 0 or missing > 0:
-            if template_status.get("installed_links"):
-                console.print("  [green]✓ Active links:[/green]")
-                for link in template_status["installed_links"]:
-                    console.print(f"    {link['target']} -> {link['source']}")
-
-            if template_status.get("broken_links"):
-                console.print("  [red]✗ Broken links:[/red]")
-                for link in template_status["broken_links"]:
-                    if link.get("status") == "wrong_target":
-                        console.print(f"    {link['target']} -> {link['actual_source']} (expected: {link['source']})")
+            if template_status.installed_links:
+                lines.append(Text("  ✓ Active links:", style="green"))
+                lines.extend(Text(f"    {link.target} -> {link.source}") for link in template_status.installed_links)
+
+            if template_status.broken_links:
+                lines.append(Text("  ✗ Broken links:", style="red"))
+                for link in template_status.broken_links:
+                    if link.status == "wrong_target":
+                        lines.append(Text(f"    {link.target} -> {link.actual_source} (expected: {link.source})"))
                     else:
-                        console.print(f"    {link['target']} (not a symlink)")
+                        lines.append(Text(f"    {link.target} (not a symlink)"))
 
-            if template_status.get("missing_links"):
-                console.print("  [yellow]○ Missing links:[/yellow]")
-                for link in template_status["missing_links"]:
-                    console.print(f"    {link['target']} -> {link['source']}")
+            if template_status.missing_links:
+                lines.append(Text("  ○ Missing links:", style="yellow"))
+                lines.extend(Text(f"    {link.target} -> {link.source}") for link in template_status.missing_links)
+
+        console.print(Text("\n").join(lines))
 
     total_templates = len(status_data)
-    fully_installed = sum(
-        1 for t in status_data if len(t.get("broken_links", ())) == 0 and len(t.get("missing_links", ())) == 0
-    )
+    fully_installed = sum(1 for t in status_data if t.is_fully_installed)
     console.print(f"\nSummary: {fully_installed}/{total_templates} templates fully installed")
 
 
-def render_text_templates(templates: list[Any], *, detailed: bool = False) -> None:
+def render_text_templates(templates: Sequence[Any], *, detailed: bool = False) -> None:
     """Render template list in text mode grouped by type.
 
-    Expects items exposing attributes: name, description, files, has_install_script(), is_dotfiles_template(),
-    is_project_template().
+    Expects items exposing attributes: name, description, files, type, has_install_script(),
+    already sorted by name as returned by template discovery.
     """
     console.print("[bold]Available templates:[/bold]")
 
-    dotfiles = [t for t in templates if t.is_dotfiles_template()]
-    projects = [t for t in templates if t.is_project_template()]
+    # Partition by type in a single pass
+    groups: dict[str, list[Any]] = {TemplateType.DOTFILES.value: [], TemplateType.PROJECT.value: []}
+    for template in templates:
+        group = groups.get(template.type)
+        if group is not None:
+            group.append(template)
 
     def _render_template_group(title: str, items: list[Any], detailed_mode: bool) -> None:
         if not items:
             return
         console.print(f"\n[bold cyan]{title}[/bold cyan]")
         if detailed_mode:
+            from rich.table import Table
+
             table = Table(show_header=True, header_style="bold magenta")
             table.add_column("Name")
             table.add_column("Description")
             table.add_column("Files")
             table.add_column("Script")
-            for template in sorted(items, key=lambda t: t.name):
+            add_row = table.add_row
+            for template in items:
                 script_indicator = "✓" if template.has_install_script() else ""
-                table.add_row(template.name, template.description, str(len(template.files)), script_indicator)
+                add_row(template.name, template.description, str(len(template.files)), script_indicator)
             console.print(table)
         else:
-            for template in sorted(items, key=lambda t: t.name):
-                script_indicator = " (with install.sh)" if template.has_install_script() else ""
-                console.print(f"  [green]{template.name}[/green] - {template.description}{script_indicator}")
-
-    _render_template_group("dotfiles/", dotfiles, detailed)
-    _render_template_group("projects/", projects, detailed)
+            # One render for the whole group; Text segments skip markup parsing of names/descriptions
+            lines = [
+                Text.assemble(
+                    "  ",
+                    (template.name, "green"),
+                    f" - {template.description}",
+                    " (with install.sh)" if template.has_install_script() else "",
+                )
+                for template in items
+            ]
+            console.print(Text("\n").join(lines))
+
+    _render_template_group("dotfiles/", groups[TemplateType.DOTFILES.value], detailed)
+    _render_template_group("projects/", groups[TemplateType.PROJECT.value], detailed)
 
     console.print(f"\nTotal: {len(templates)} template{'s' if len(templates) != 1 else ''}")
@@ -1,14 +1,38 @@
 """Templates library for file copying operations."""
 
+import os
+import sys
+import errno
 import shutil
 import logging
+import unicodedata
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import fcntl
+
+    _HAS_FCNTL = True
+except ImportError:  # pragma: no cover - not available on Windows
+    _HAS_FCNTL = False
 
 from ..models.template import Template
 from ..models.project_file import ProjectFile
 
 logger = logging.getLogger(__name__)
 
+# copy_file_range errors that mean "not supported here" rather than a real IO failure
+_COPY_FALLBACK_ERRNOS = frozenset({errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP, errno.EINVAL})
+
+# FICLONE ioctl from linux/fs.h: share the source extents copy-on-write (btrfs, XFS, ...)
+_FICLONE = 0x40049409
+_REFLINK_SUPPORTED = _HAS_FCNTL and sys.platform.startswith("linux")
+
+
+def _fold_name(name: str) -> str:
+    """Normalize a file name the way case-insensitive, normalizing filesystems compare names."""
+    return unicodedata.normalize("NFC", name).casefold()
+
 
 class TemplatesManager:
     """Manages project template application through file copying.
@@ -17,9 +41,17 @@ class TemplatesManager:
     one-time initialization of new projects.
     """
 
-    def __init__(self):
-        """Initialize the templates manager."""
+    def __init__(self, max_workers: int = 4):
+        """Initialize the templates manager.
+
+        Args:
+            max_workers: Maximum number of files copied concurrently
+        """
         self.logger = logger
+        self.max_workers = max_workers
+        # (source st_dev, target st_dev) pairs where a kernel-side copy was refused
+        self._no_reflink: set[tuple[int, int]] = set()
+        self._no_copy_range: set[tuple[int, int]] = set()
 
     def apply_template(
         self,
@@ -64,22 +96,33 @@ class TemplatesManager:
                 self.logger.warning(f"Source file does not exist: {source}")
                 continue
 
-            files_to_copy.append((source, target))
+            files_to_copy.append((source, target, Path(file_path)))
 
         if dry_run:
             self.logger.info(f"DRY RUN: Would copy {len(files_to_copy)} files for template {template.name}")
-            for source, target in files_to_copy:
+            for source, target, _relative in files_to_copy:
                 self.logger.info(f"  {source} -> {target}")
             # Create ProjectFile objects for dry run
-            for source, target in files_to_copy:
+            for source, target, relative in files_to_copy:
                 if source.exists():
-                    copied_files.append(ProjectFile.create_from_copy(source, target, template.name))
+                    copied_files.append(
+                        ProjectFile.create_from_copy(source, target, template.name, relative_target=relative)
+                    )
             return True, copied_files
 
-        # Copy files
+        # Copy files; copies are independent and IO-bound, so overlap them in a small pool
+        def copy_pair(pair: tuple[Path, Path, Path]) -> ProjectFile | None:
+            source, target, relative = pair
+            return self._copy_single_file(source, target, template.name, force, relative_target=relative)
+
+        if self.max_workers > 1 and len(files_to_copy) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(files_to_copy))) as executor:
+                results = list(executor.map(copy_pair, files_to_copy))
+        else:
+            results = [copy_pair(pair) for pair in files_to_copy]
+
         success = True
-        for source, target in files_to_copy:
-            project_file = self._copy_single_file(source, target, template.name, force)
+        for project_file in results:
             if project_file:
                 copied_files.append(project_file)
             else:
@@ -89,7 +132,12 @@ class TemplatesManager:
         return success, copied_files
 
     def _copy_single_file(
-        self, source: Path, target: Path, template_name: str, force: bool = False
+        self,
+        source: Path,
+        target: Path,
+        template_name: str,
+        force: bool = False,
+        relative_target: Path | None = None,
     ) -> ProjectFile | None:
         """Copy a single file from source to target.
 
@@ -98,6 +146,7 @@ class TemplatesManager:
             target: Target file path
             template_name: Name of the template
             force: Whether to overwrite existing files
+            relative_target: Target path relative to the project directory
 
         Returns:
             ProjectFile object if successful, None otherwise
@@ -112,10 +161,10 @@ class TemplatesManager:
             target.parent.mkdir(parents=True, exist_ok=True)
 
             # Copy the file
-            shutil.copy2(source, target)
+            self._copy_file(source, target)
 
             # Create ProjectFile record
-            project_file = ProjectFile.create_from_copy(source, target, template_name)
+            project_file = ProjectFile.create_from_copy(source, target, template_name, relative_target=relative_target)
 
             self.logger.debug(f"Copied file: {source} -> {target}")
             return project_file
@@ -127,6 +176,83 @@ class TemplatesManager:
             self.logger.error(f"Unexpected error copying {source}: {e}")
             return None
 
+    def _copy_file(self, source: Path, target: Path) -> None:
+        """Copy file contents and metadata, letting the kernel move the data when possible.
+
+        A copy-on-write reflink is tried first, then copy_file_range, then a plain
+        copy. Filesystem pairs that refuse a method are remembered so it is not
+        retried for every file.
+
+        Args:
+            source: Source file path
+            target: Target file path
+
+        Raises:
+            OSError: If the copy fails
+        """
+        with open(source, "rb") as src, open(target, "wb") as dst:
+            src_fd, dst_fd = src.fileno(), dst.fileno()
+            size = os.fstat(src_fd).st_size
+            devices = (os.fstat(src_fd).st_dev, os.fstat(dst_fd).st_dev)
+            copied = self._reflink(src_fd, dst_fd, devices) or self._copy_range(src_fd, dst_fd, size, devices)
+
+        if copied:
+            shutil.copystat(source, target)
+        else:
+            shutil.copy2(source, target)
+
+    def _reflink(self, src_fd: int, dst_fd: int, devices: tuple[int, int]) -> bool:
+        """Clone the source extents into the target with the FICLONE ioctl.
+
+        Args:
+            src_fd: Source file descriptor
+            dst_fd: Target file descriptor
+            devices: Source and target device IDs
+
+        Returns:
+            True if the file was cloned, False if reflinks are unsupported here
+        """
+        if not _REFLINK_SUPPORTED or devices in self._no_reflink:
+            return False
+        try:
+            fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+            return True
+        except OSError as e:
+            if e.errno not in _COPY_FALLBACK_ERRNOS and e.errno != errno.ENOTTY:
+                raise
+            self._no_reflink.add(devices)
+            return False
+
+    def _copy_range(self, src_fd: int, dst_fd: int, size: int, devices: tuple[int, int]) -> bool:
+        """Copy file data in the kernel with copy_file_range.
+
+        Args:
+            src_fd: Source file descriptor
+            dst_fd: Target file descriptor
+            size: Number of bytes to copy
+            devices: Source and target device IDs
+
+        Returns:
+            True if the data was copied, False if copy_file_range is unsupported here
+        """
+        if not hasattr(os, "copy_file_range") or devices in self._no_copy_range:
+            return False
+        try:
+            remaining = size
+            while remaining > 0:
+                copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                if copied == 0:
+                    # Some filesystems report success without copying; treat a short copy as unsupported
+                    self._no_copy_range.add(devices)
+                    return False
+                remaining -= copied
+            return True
+        except OSError as e:
+            if e.errno not in _COPY_FALLBACK_ERRNOS:
+                raise
+            self._no_copy_range.add(devices)
+            return False
+
     def copy_template(self, source_dir: Path, target_dir: Path, exclude_patterns: list[str] | None = None) -> bool:
         """Copy entire template directory to target directory.
 
@@ -211,12 +337,33 @@ class TemplatesManager:
 
         conflicts = []
 
+        # List each target directory once instead of stat-ing every target path. Folded names
+        # catch entries a case-insensitive or normalizing filesystem (macOS) would also match.
+        existing_names: dict[Path, tuple[set[str], set[str]]] = {}
+
         # Check explicit files
         for file_path in template.files:
             source = template_path / file_path
             target = target_directory / file_path
 
-            if source.exists() and target.exists():
+            listing = existing_names.get(target.parent)
+            if listing is None:
+                try:
+                    with os.scandir(target.parent) as entries:
+                        names = {entry.name for entry in entries}
+                except OSError:
+                    names = set()
+                listing = (names, {_fold_name(name) for name in names})
+                existing_names[target.parent] = listing
+
+            names, folded = listing
+            if target.name in names:
+                exists = True
+            else:
+                # Only a name that differs in case or normalization needs the filesystem's own answer
+                exists = _fold_name(target.name) in folded and target.exists()
+
+            if exists and source.exists():
                 conflicts.append((source, target))
 
         # Only consider files declared in template.files
@@ -5,7 +5,6 @@ from pathlib import Path
 
 import click
 import typer
-from rich.logging import RichHandler
 
 from . import __version__
 from .models.enums import OutputFormat
@@ -26,6 +25,9 @@ _FORMAT_OPTION = typer.Option(None, "--format", help="Output format (overrides c
 
 def setup_logging(verbose: bool = False, quiet: bool = False) -> None:
     """Setup logging configuration."""
+    # rich.logging pulls in rich.traceback and rich.syntax; --version and --help never get here
+    from rich.logging import RichHandler
+
     if quiet:
         level = logging.WARNING
     elif verbose:
@@ -53,6 +55,7 @@ def main(
     verbose: bool = typer.Option(False, "--verbose", help="Enable verbose logging"),
     quiet: bool = typer.Option(False, "--quiet", help="Suppress non-error output"),
     format_type: OutputFormat | None = _FORMAT_OPTION,
+    no_sync: bool = typer.Option(False, "--no-sync", help="Use the cached repository without syncing"),
 ):
     """Claude Code Configuration Manager CLI.
 
@@ -77,6 +80,7 @@ def main(
             verbose=verbose,
             quiet=quiet,
             format_type=format_type.value if format_type else None,
+            no_sync=no_sync,
         )
     except Exception as e:
         # Ensure repository/config errors return consistent exit codes during callback
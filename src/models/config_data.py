@@ -15,6 +15,7 @@ class ConfigData(BaseModel):
     # Repository settings
     default_repo_url: str | None = Field(None, description="Default config repository URL")
     repo_branch: str = Field(default="main", description="Default branch to use")
+    shallow: bool = Field(default=True, description="Clone and fetch only the branch tip")
 
     # Path settings
     user_home: Path = Field(default_factory=lambda: Path.home(), description="User's home directory path")
@@ -26,6 +27,7 @@ class ConfigData(BaseModel):
     log_level: str = Field(default="info", description="Logging level")
     default_format: str = Field(default="text", description="Default output format")
     auto_sync: bool = Field(default=True, description="Automatically sync before operations")
+    sync_ttl: int = Field(default=300, ge=0, le=86400, description="Seconds a synced repository stays fresh")
     prompt_for_scripts: bool = Field(default=True, description="Prompt before executing install.sh")
 
     # Advanced settings
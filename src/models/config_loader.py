@@ -1,9 +1,10 @@
 """Configuration file I/O operations."""
 
 from pathlib import Path
+from functools import lru_cache
 
-import tomli_w
 import tomllib
+from pydantic import PrivateAttr
 
 from .config_data import ConfigData
 from .config_validator import ConfigValidationMixin
@@ -12,6 +13,9 @@ from .config_validator import ConfigValidationMixin
 class CLIConfig(ConfigData, ConfigValidationMixin):
     """CLI Configuration with validation and I/O capabilities."""
 
+    # Last resolved repo cache dir, keyed by the inputs it was derived from
+    _repo_cache_dir: tuple[tuple[str | None, Path], Path] | None = PrivateAttr(default=None)
+
     @classmethod
     def load_from_file(cls, config_path: Path | None = None) -> "CLIConfig":
         """Load configuration from file or create default."""
@@ -20,30 +24,15 @@ class CLIConfig(ConfigData, ConfigValidationMixin):
         if config_path is None:
             config_path = PathResolver.get_default_config_dir() / "config.toml"
 
+        try:
+            stat = config_path.stat()
+        except OSError:
+            stat = None
+
         # Try to load existing configuration
-        if config_path.exists() and config_path.stat().st_size > 0:
-            try:
-                with open(config_path, "rb") as f:
-                    data = tomllib.load(f)
-
-                # Extract configuration values
-                repo_data = data.get("repository", {})
-                behavior_data = data.get("behavior", {})
-                advanced_data = data.get("advanced", {})
-
-                config = cls(
-                    default_repo_url=repo_data.get("url"),
-                    repo_branch=repo_data.get("branch", "main"),
-                    log_level=behavior_data.get("log_level", "info"),
-                    default_format=behavior_data.get("default_format", "text"),
-                    auto_sync=behavior_data.get("auto_sync", True),
-                    prompt_for_scripts=behavior_data.get("prompt_for_scripts", True),
-                    max_parallel_operations=advanced_data.get("max_parallel_operations", 4),
-                    sync_timeout=advanced_data.get("sync_timeout", 300),
-                )
-            except (tomllib.TOMLDecodeError, ValueError, OSError):
-                # If config file is corrupted or unreadable, create default
-                config = cls()
+        if stat is not None and stat.st_size > 0:
+            # Callers mutate the config (e.g. --repo override), so never hand out the cached instance
+            config = _load_cached(cls, str(config_path), stat.st_mtime_ns, stat.st_size).model_copy(deep=True)
         else:
             # Create default configuration if file doesn't exist
             config = cls()
@@ -56,6 +45,9 @@ class CLIConfig(ConfigData, ConfigValidationMixin):
 
     def save_to_file(self, config_path: Path | None = None) -> None:
         """Save configuration to file using TOML format."""
+        # Writer is only needed here; loading goes through the stdlib tomllib parser
+        import tomli_w
+
         if config_path is None:
             config_path = self.config_dir / "config.toml"
 
@@ -67,11 +59,13 @@ class CLIConfig(ConfigData, ConfigValidationMixin):
             "repository": {
                 "url": self.default_repo_url,
                 "branch": self.repo_branch,
+                "shallow": self.shallow,
             },
             "behavior": {
                 "log_level": self.log_level,
                 "default_format": self.default_format,
                 "auto_sync": self.auto_sync,
+                "sync_ttl": self.sync_ttl,
                 "prompt_for_scripts": self.prompt_for_scripts,
             },
             "advanced": {
@@ -84,12 +78,23 @@ class CLIConfig(ConfigData, ConfigValidationMixin):
         with open(config_path, "wb") as f:
             tomli_w.dump(config_data, f)
 
+        _load_cached.cache_clear()
+
     def get_repo_cache_dir(self, repo_url: str | None = None) -> Path:
-        """Get cache directory for a repository."""
+        """Get cache directory for a repository.
+
+        The result is memoized against the URL and config dir it was built from, so
+        repeated calls are a tuple compare and changing either setting is picked up.
+        """
         from .config_paths import PathResolver
 
-        path_resolver = PathResolver(self)
-        return path_resolver.get_repo_cache_dir(repo_url)
+        key = (repo_url if repo_url is not None else self.default_repo_url, self.config_dir)
+        if self._repo_cache_dir is not None and self._repo_cache_dir[0] == key:
+            return self._repo_cache_dir[1]
+
+        cache_dir = PathResolver(self).get_repo_cache_dir(repo_url)
+        self._repo_cache_dir = (key, cache_dir)
+        return cache_dir
 
     def ensure_config_dirs(self) -> None:
         """Ensure all configuration directories exist."""
@@ -98,9 +103,45 @@ class CLIConfig(ConfigData, ConfigValidationMixin):
         path_resolver = PathResolver(self)
         path_resolver.ensure_config_dirs()
 
+    def get_template_cache_dir(self) -> Path:
+        """Get directory holding cached template discovery results."""
+        from .config_paths import PathResolver
+
+        path_resolver = PathResolver(self)
+        return path_resolver.get_template_cache_dir()
+
     def get_state_file(self) -> Path:
         """Get path to state file."""
         from .config_paths import PathResolver
 
         path_resolver = PathResolver(self)
         return path_resolver.get_state_file()
+
+
+@lru_cache(maxsize=8)
+def _load_cached(config_cls: type[CLIConfig], path: str, mtime_ns: int, size: int) -> CLIConfig:  # noqa: ARG001
+    """Parse a config file once per (path, mtime, size) for the process lifetime."""
+    try:
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+
+        # Extract configuration values
+        repo_data = data.get("repository", {})
+        behavior_data = data.get("behavior", {})
+        advanced_data = data.get("advanced", {})
+
+        return config_cls(
+            default_repo_url=repo_data.get("url"),
+            repo_branch=repo_data.get("branch", "main"),
+            shallow=repo_data.get("shallow", True),
+            log_level=behavior_data.get("log_level", "info"),
+            default_format=behavior_data.get("default_format", "text"),
+            auto_sync=behavior_data.get("auto_sync", True),
+            sync_ttl=behavior_data.get("sync_ttl", 300),
+            prompt_for_scripts=behavior_data.get("prompt_for_scripts", True),
+            max_parallel_operations=advanced_data.get("max_parallel_operations", 4),
+            sync_timeout=advanced_data.get("sync_timeout", 300),
+        )
+    except (tomllib.TOMLDecodeError, ValueError, OSError):
+        # If config file is corrupted or unreadable, create default
+        return config_cls()
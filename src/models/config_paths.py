@@ -40,6 +40,10 @@ class PathResolver:
         (self.config_data.config_dir / "repos").mkdir(exist_ok=True)
         (self.config_data.config_dir / "state").mkdir(exist_ok=True)
 
+    def get_template_cache_dir(self) -> Path:
+        """Get directory holding cached template discovery results."""
+        return self.config_data.config_dir / "cache"
+
     def get_state_file(self) -> Path:
         """Get path to state file."""
         return self.config_data.config_dir / "state" / "application_state.json"
@@ -14,6 +14,7 @@ class ProjectFile(BaseModel):
     Fields:
         source: Path to file in template
         target: Path to copied file in project
+        relative_target: Target path relative to the project directory
         template_name: Template that created this file
         copied_at: When file was copied
         checksum: SHA256 hash of copied content
@@ -31,6 +32,8 @@ class ProjectFile(BaseModel):
 
     target: Path = Field(..., description="Path to copied file in project")
 
+    relative_target: Path | None = Field(None, description="Target path relative to the project directory")
+
     template_name: str = Field(..., min_length=1, description="Template that created this file")
 
     copied_at: datetime = Field(default_factory=datetime.now, description="When file was copied")
@@ -62,7 +65,9 @@ class ProjectFile(BaseModel):
         return v
 
     @classmethod
-    def create_from_copy(cls, source: Path, target: Path, template_name: str) -> "ProjectFile":
+    def create_from_copy(
+        cls, source: Path, target: Path, template_name: str, relative_target: Path | None = None
+    ) -> "ProjectFile":
         """Create ProjectFile instance after copying file."""
         if not source.exists():
             raise FileNotFoundError(f"Source file does not exist: {source}")
@@ -75,6 +80,7 @@ class ProjectFile(BaseModel):
         return cls(
             source=source,
             target=target,
+            relative_target=relative_target,
             template_name=template_name,
             checksum=checksum,
             file_size=file_size,
@@ -175,6 +181,10 @@ class ProjectFile(BaseModel):
     def _serialize_path(self, v: Path) -> str:  # noqa: D401
         return str(v)
 
+    @field_serializer("relative_target")
+    def _serialize_relative_path(self, v: Path | None) -> str | None:  # noqa: D401
+        return str(v) if v is not None else None
+
     @field_serializer("copied_at")
     def _serialize_dt(self, v: datetime):  # noqa: D401
         return v.isoformat()
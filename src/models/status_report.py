@@ -0,0 +1,54 @@
+"""Lightweight records produced by the status command."""
+
+from typing import Any
+from dataclasses import field, dataclass
+
+
+@dataclass(slots=True)
+class LinkStatus:
+    """State of one expected dotfile symlink.
+
+    Fields:
+        target: Symlink location in the user's home
+        source: File in the repository the link should point to
+        status: One of "ok", "wrong_target", "not_symlink" or "missing"
+        actual_source: Where the link points instead (wrong_target only)
+    """
+
+    target: str
+    source: str
+    status: str
+    actual_source: str | None = None
+
+    def to_dict(self) -> dict[str, str]:
+        """Convert to the JSON output shape, omitting unset fields."""
+        data = {"target": self.target, "source": self.source, "status": self.status}
+        if self.actual_source is not None:
+            data["actual_source"] = self.actual_source
+        return data
+
+
+@dataclass(slots=True)
+class TemplateStatus:
+    """Link states of one dotfiles template, grouped by outcome."""
+
+    name: str
+    description: str
+    installed_links: list[LinkStatus] = field(default_factory=list)
+    broken_links: list[LinkStatus] = field(default_factory=list)
+    missing_links: list[LinkStatus] = field(default_factory=list)
+
+    @property
+    def is_fully_installed(self) -> bool:
+        """Check if every expected link is in place."""
+        return not self.broken_links and not self.missing_links
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to the JSON output shape."""
+        return {
+            "name": self.name,
+            "description": self.description,
+            "installed_links": [link.to_dict() for link in self.installed_links],
+            "broken_links": [link.to_dict() for link in self.broken_links],
+            "missing_links": [link.to_dict() for link in self.missing_links],
+        }
@@ -94,14 +94,20 @@ class Template(BaseModel):
 
     def has_install_script(self) -> bool:
         """Check if template has an install script."""
-        return self.install_script is not None and bool(self.install_script.strip())
+        # The validator (also run on assignment) already maps blank values to None
+        return self.install_script is not None
 
-    def get_install_script_path(self) -> Path | None:
-        """Get full path to install script if it exists."""
-        if not self.has_install_script() or self.template_path is None:
+    @property
+    def install_script_path(self) -> Path | None:
+        """Full path to the install script, None if the template has none."""
+        if not self.install_script or self.template_path is None:
             return None
         return self.template_path / self.install_script
 
+    def get_install_script_path(self) -> Path | None:
+        """Get full path to install script if it exists."""
+        return self.install_script_path
+
     def get_file_paths(self) -> list[Path]:
         """Get full paths to all template files."""
         if self.template_path is None:
@@ -67,6 +67,27 @@ class TestCliRealFunctionality(TestWithIsolation):
         # Should show active links
         assert "active" in status_result.stdout.lower() or "✓" in status_result.stdout
 
+    def test_status_json_reports_each_template_once(self):
+        """Test that status groups links per template without duplicating entries."""
+        for name in ("alpha", "beta"):
+            template_dir = self.temp_repo_cache / "dotfiles" / name
+            template_dir.mkdir(parents=True)
+            for file_name in (f".{name}rc", f".{name}_profile", f".{name}_aliases"):
+                (template_dir / file_name).write_text(f"# {file_name}\n")
+
+        install_result = self.invoke_cli_with_test_config(["install", "alpha"])
+        assert install_result.exit_code == 0
+
+        status_result = self.invoke_cli_with_test_config(["--format", "json", "status"])
+        assert status_result.exit_code == 0
+
+        templates = {t["name"]: t for t in json.loads(status_result.stdout)["templates"]}
+        assert len(templates) == 2
+        assert len(templates["alpha"]["installed_links"]) == 3
+        assert not templates["alpha"]["missing_links"]
+        assert len(templates["beta"]["missing_links"]) == 3
+        assert not templates["beta"]["installed_links"]
+
     def test_status_command_with_template_filter(self):
         """Test status command with template filtering."""
         # Create and install test template
@@ -132,6 +153,14 @@ class TestCliRealFunctionality(TestWithIsolation):
         result = self.invoke_cli_with_test_config(["config", "show"])
         # May succeed or fail, but should exercise config logic
 
+    def test_aborted_prompt_is_not_reported_as_error(self):
+        """Test that aborting a confirmation prompt exits like click's abort, not as a command error."""
+        result = self.invoke_cli_with_test_config(["config", "reset"], input="")
+
+        assert result.exit_code == 1
+        assert "Aborted" in result.output
+        assert "Error:" not in result.output
+
     def test_error_handling_with_invalid_template(self):
         """Test error handling with various invalid inputs."""
         # Test with completely invalid template name
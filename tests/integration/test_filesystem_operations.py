@@ -207,3 +207,235 @@ class TestFilesystemOperationsIntegration:
         assert len(status) >= 2
         assert any(s["target"] == str(target_file1) for s in status)
         assert any(s["target"] == str(target_file2) for s in status)
+
+    def test_symlinks_status_reports_broken_links_and_skips_dependency_trees(self):
+        """Test that the symlink scan flags broken links and prunes dependency trees only."""
+        from src.lib.dotfiles import DotfilesManager
+
+        target_dir = Path(self.temp_target)
+        dotfiles_manager = DotfilesManager(user_home=target_dir)
+
+        source_file = Path(self.temp_source) / "init.vim"
+        source_file.write_text("set number")
+        (target_dir / ".config" / "nvim").mkdir(parents=True)
+        (target_dir / ".config" / "nvim" / "init.vim").symlink_to(source_file)
+        (target_dir / ".broken").symlink_to(Path(self.temp_source) / "missing")
+        (target_dir / "node_modules" / "pkg").mkdir(parents=True)
+        (target_dir / "node_modules" / "pkg" / "link").symlink_to(source_file)
+        (target_dir / ".cache" / "build").mkdir(parents=True)
+        (target_dir / ".cache" / "build" / "tool.conf").symlink_to(source_file)
+
+        status = {s["relative_to_home"]: s for s in dotfiles_manager.check_symlinks_status()}
+
+        assert set(status) == {".config/nvim/init.vim", ".broken", ".cache/build/tool.conf"}
+        assert status[".config/nvim/init.vim"]["source"] == str(source_file.resolve())
+        assert status[".config/nvim/init.vim"]["exists"] and not status[".config/nvim/init.vim"]["broken"]
+        assert status[".broken"]["source"] == str(Path(self.temp_source) / "missing")
+        assert status[".broken"]["broken"] and not status[".broken"]["exists"]
+
+    def test_list_installed_templates_groups_links_by_template(self):
+        """Test that installed links are grouped by the repository template they point into."""
+        from src.lib.dotfiles import DotfilesManager
+
+        home = Path(self.temp_target)
+        repo = Path(self.temp_source)
+        dotfiles_manager = DotfilesManager(user_home=home)
+
+        for template_name, file_name in [("vim", ".vimrc"), ("zsh", ".zshrc")]:
+            source = repo / "dotfiles" / template_name / file_name
+            source.parent.mkdir(parents=True)
+            source.write_text("")
+            (home / file_name).symlink_to(source)
+        (home / ".unrelated").symlink_to(repo)
+
+        installed = dotfiles_manager.list_installed_templates(repo)
+
+        assert sorted(installed) == ["vim", "zsh"]
+        assert [link.target for link in installed["vim"]] == [home / ".vimrc"]
+        assert [link.source for link in installed["zsh"]] == [repo / "dotfiles" / "zsh" / ".zshrc"]
+
+    def test_remove_template_links_only_removes_symlinks(self):
+        """Test that removing a template unlinks its symlinks and leaves regular files alone."""
+        from src.lib.dotfiles import DotfilesManager
+        from src.models.template import Template, TemplateType
+
+        home = Path(self.temp_target)
+        repo = Path(self.temp_source)
+        dotfiles_manager = DotfilesManager(user_home=home)
+
+        files = [".vimrc", ".config/nvim/init.vim", ".gitconfig"]
+        for file_path in files:
+            (repo / "dotfiles" / "dev" / file_path).parent.mkdir(parents=True, exist_ok=True)
+            (repo / "dotfiles" / "dev" / file_path).write_text("")
+        template = Template(name="dev", description="Dev", type=TemplateType.DOTFILES, files=files)
+        dotfiles_manager.install_template(template, repo)
+        (home / ".gitconfig").unlink()
+        (home / ".gitconfig").write_text("[user]")
+
+        assert dotfiles_manager.remove_template_links(template, repo, dry_run=True) == (True, 2)
+        assert (home / ".vimrc").is_symlink()
+
+        assert dotfiles_manager.remove_template_links(template, repo) == (True, 2)
+        assert not (home / ".vimrc").exists() and not (home / ".config" / "nvim" / "init.vim").exists()
+        assert (home / ".gitconfig").read_text() == "[user]"
+
+    def test_install_template_creates_many_links_in_parallel(self):
+        """Test that installing a large template links every file, including with a worker pool."""
+        from src.lib.dotfiles import DotfilesManager
+        from src.models.template import Template, TemplateType
+
+        home = Path(self.temp_target)
+        repo = Path(self.temp_source)
+        files = [f".config/app{i % 3}/file{i}" for i in range(20)]
+        for file_path in files:
+            (repo / "dotfiles" / "big" / file_path).parent.mkdir(parents=True, exist_ok=True)
+            (repo / "dotfiles" / "big" / file_path).write_text(file_path)
+        template = Template(name="big", description="Big", type=TemplateType.DOTFILES, files=files)
+
+        success, links = DotfilesManager(user_home=home, max_workers=4).install_template(template, repo)
+
+        assert success
+        assert [link.target for link in links] == [home / f for f in files]
+        for file_path in files:
+            assert (home / file_path).is_symlink()
+            assert (home / file_path).read_text() == file_path
+
+    def test_detects_nested_file_conflicts(self):
+        """Test that conflicts are found for top-level and nested template files."""
+        from src.lib.templates import TemplatesManager
+        from src.models.template import Template, TemplateType
+
+        templates_manager = TemplatesManager()
+
+        template_dir = Path(self.temp_source) / "projects" / "app"
+        (template_dir / "src").mkdir(parents=True)
+        (template_dir / "README.md").write_text("# App")
+        (template_dir / "src" / "main.py").write_text("print('app')")
+        (template_dir / "src" / "util.py").write_text("")
+        template = Template(
+            name="app",
+            description="App template",
+            type=TemplateType.PROJECT,
+            files=["README.md", "src/main.py", "src/util.py"],
+        )
+
+        target_dir = Path(self.temp_target)
+        (target_dir / "src").mkdir()
+        (target_dir / "src" / "main.py").write_text("existing")
+
+        conflicts = templates_manager.check_file_conflicts(template, Path(self.temp_source), target_dir)
+
+        assert conflicts == [(template_dir / "src" / "main.py", target_dir / "src" / "main.py")]
+
+    def test_check_file_conflicts_defers_case_variants_to_the_filesystem(self):
+        """Test that a target differing only in case is a conflict exactly when the filesystem says it exists."""
+        from unittest.mock import patch
+
+        from src.lib.templates import TemplatesManager
+        from src.models.template import Template, TemplateType
+
+        templates_manager = TemplatesManager()
+
+        template_dir = Path(self.temp_source) / "projects" / "app"
+        template_dir.mkdir(parents=True)
+        (template_dir / "README.md").write_text("# App")
+        template = Template(name="app", description="App template", type=TemplateType.PROJECT, files=["README.md"])
+
+        target_dir = Path(self.temp_target)
+        (target_dir / "readme.md").write_text("existing")
+        target = target_dir / "README.md"
+
+        # Whatever this filesystem's case rules are, the answer must match Path.exists()
+        expected = [(template_dir / "README.md", target)] if target.exists() else []
+        assert templates_manager.check_file_conflicts(template, Path(self.temp_source), target_dir) == expected
+
+        # On a case-insensitive volume README.md resolves to the existing readme.md
+        real_exists = Path.exists
+        with patch.object(Path, "exists", autospec=True, side_effect=lambda p: p == target or real_exists(p)):
+            conflicts = templates_manager.check_file_conflicts(template, Path(self.temp_source), target_dir)
+        assert conflicts == [(template_dir / "README.md", target)]
+
+    def test_apply_template_copies_files_concurrently(self):
+        """Test that a project template is fully copied when copies run in parallel."""
+        from src.lib.templates import TemplatesManager
+        from src.models.template import Template, TemplateType
+
+        templates_manager = TemplatesManager(max_workers=4)
+
+        template_dir = Path(self.temp_source) / "projects" / "app"
+        (template_dir / "src").mkdir(parents=True)
+        files = ["README.md"] + [f"src/module_{i}.py" for i in range(8)]
+        for file_path in files:
+            (template_dir / file_path).write_text(f"# {file_path}\n")
+        (template_dir / "README.md").chmod(0o640)
+        template = Template(name="app", description="App template", type=TemplateType.PROJECT, files=files)
+
+        success, project_files = templates_manager.apply_template(
+            template, Path(self.temp_source), Path(self.temp_target)
+        )
+
+        assert success
+        assert [pf.target for pf in project_files] == [Path(self.temp_target) / f for f in files]
+        for file_path in files:
+            assert (Path(self.temp_target) / file_path).read_text() == f"# {file_path}\n"
+        assert (Path(self.temp_target) / "README.md").stat().st_mode & 0o777 == 0o640
+
+    def test_short_kernel_copy_falls_back_to_plain_copy(self):
+        """Test that a copy_file_range that stops before the end of the file is not reported as a copy."""
+        from unittest.mock import patch
+
+        from src.lib.templates import TemplatesManager
+
+        templates_manager = TemplatesManager()
+        source = Path(self.temp_source) / "data.txt"
+        source.write_text("x" * 4096)
+        target = Path(self.temp_target) / "data.txt"
+
+        with (
+            patch("src.lib.templates._REFLINK_SUPPORTED", False),
+            patch("os.copy_file_range", return_value=0, create=True) as copy_file_range,
+        ):
+            templates_manager._copy_file(source, target)
+            templates_manager._copy_file(source, target)
+
+        assert target.read_text() == "x" * 4096
+        # The refusal is remembered for the device pair, so the second copy skips the kernel call
+        assert copy_file_range.call_count == 1
+
+    def test_probe_links_batches_lstat_and_readlink_in_order(self):
+        """Test that batched link probes match per-path results across listed, stat'ed and threaded paths."""
+        import stat
+
+        from src.lib.fs_batch import probe_links
+
+        source = Path(self.temp_source) / "config"
+        source.write_text("data")
+        target_dir = Path(self.temp_target)
+
+        # Even entries share one directory (answered from a listing), odd ones each get their own
+        # directory (stat'ed individually, threaded at 4 workers), plus a parent that does not exist
+        paths = []
+        for i in range(400):
+            if i % 2 == 0:
+                path = target_dir / f"entry{i}"
+            else:
+                path = target_dir / f"dir{i}" / "entry"
+                path.parent.mkdir()
+            if i % 3 == 0:
+                path.symlink_to(source)
+            elif i % 3 == 1:
+                path.write_text("plain")
+            paths.append(str(path))
+        missing = [str(target_dir / "absent" / f"entry{i}") for i in range(10)]
+
+        for max_workers in (1, 4):
+            probes = probe_links(paths + missing, max_workers=max_workers)
+            assert len(probes) == len(paths) + len(missing)
+            for i, (mode, link_text) in enumerate(probes[: len(paths)]):
+                if i % 3 == 0:
+                    assert mode == stat.S_IFLNK and link_text == str(source)
+                elif i % 3 == 1:
+                    assert mode == stat.S_IFREG and link_text is None
+                else:
+                    assert mode is None and link_text is None
+            assert probes[len(paths) :] == [(None, None)] * len(missing)
@@ -146,3 +146,231 @@ class TestGitOperationsIntegration:
         # Try to clone from unreachable repository
         success = git_ops.clone_repository("git://unreachable-host/repo.git", self.temp_clone_dir)
         assert not success
+
+    def test_discover_templates_cached_reuses_results_for_same_head(self):
+        """Test that template discovery is cached per HEAD commit."""
+        from src.lib.git_ops import GitOperations
+
+        git_ops = GitOperations()
+        cache_dir = Path(tempfile.mkdtemp())
+
+        repo = Repo.init(self.temp_repo_dir)
+        template_dir = Path(self.temp_repo_dir) / "dotfiles" / "vim-config"
+        template_dir.mkdir(parents=True)
+        (template_dir / ".vimrc").write_text("set number")
+        repo.index.add(["dotfiles/vim-config/.vimrc"])
+        commit = repo.index.commit("Add template")
+
+        templates = git_ops.discover_templates_cached(self.temp_repo_dir, cache_dir)
+        assert [t.name for t in templates] == ["vim-config"]
+        assert (cache_dir / f"template-cache-{commit.hexsha}.json").exists()
+
+        # Untracked changes are not seen while HEAD is unchanged
+        (Path(self.temp_repo_dir) / "dotfiles" / "zsh-config").mkdir()
+        (Path(self.temp_repo_dir) / "dotfiles" / "zsh-config" / ".zshrc").write_text("export A=1")
+        cached = git_ops.discover_templates_cached(self.temp_repo_dir, cache_dir)
+        assert [t.name for t in cached] == ["vim-config"]
+        assert cached[0].template_path == template_dir
+
+        git_ops.clear_template_cache(cache_dir)
+        assert not list(cache_dir.glob("template-cache-*.json"))
+        refreshed = git_ops.discover_templates_cached(self.temp_repo_dir, cache_dir)
+        assert sorted(t.name for t in refreshed) == ["vim-config", "zsh-config"]
+
+    def test_shallow_clone_and_sync_fetch_only_branch_tip(self):
+        """Test that shallow clone and sync keep only the branch tip."""
+        from src.lib.git_ops import GitOperations
+
+        git_ops = GitOperations()
+
+        repo = Repo.init(self.temp_repo_dir)
+        test_file = Path(self.temp_repo_dir) / "config.txt"
+        for version in ("version 1", "version 2"):
+            test_file.write_text(version)
+            repo.index.add(["config.txt"])
+            repo.index.commit(version)
+
+        # file:// URL so git honours --depth for a local source
+        repo_url = f"file://{self.temp_repo_dir}"
+        assert git_ops.clone_repository(repo_url, self.temp_clone_dir, shallow=True)
+        clone = Repo(self.temp_clone_dir)
+        assert len(list(clone.iter_commits())) == 1
+
+        test_file.write_text("version 3")
+        repo.index.add(["config.txt"])
+        repo.index.commit("version 3")
+
+        assert git_ops.sync_repository(Path(self.temp_clone_dir), "main", shallow=True)
+        assert (Path(self.temp_clone_dir) / "config.txt").read_text() == "version 3"
+        assert len(list(clone.iter_commits())) == 1
+
+    def test_clone_many_reports_each_clone_by_local_path(self):
+        """Test that cloning several repositories concurrently reports success per destination."""
+        from src.lib.git_ops import GitOperations
+
+        git_ops = GitOperations()
+
+        repo = Repo.init(self.temp_repo_dir)
+        (Path(self.temp_repo_dir) / "README.md").write_text("# Test Repository")
+        repo.index.add(["README.md"])
+        repo.index.commit("Initial commit")
+
+        clone_root = Path(self.temp_clone_dir)
+        specs = [(self.temp_repo_dir, clone_root / f"clone{i}", "main") for i in range(3)]
+        specs.append((str(clone_root / "missing-remote"), clone_root / "broken", "main"))
+
+        results = git_ops.clone_many(specs, max_workers=2)
+
+        assert results == {
+            str(clone_root / "clone0"): True,
+            str(clone_root / "clone1"): True,
+            str(clone_root / "clone2"): True,
+            str(clone_root / "broken"): False,
+        }
+        for i in range(3):
+            assert (clone_root / f"clone{i}" / "README.md").read_text() == "# Test Repository"
+        assert git_ops.clone_many([]) == {}
+
+    def test_is_up_to_date_compares_remote_branch_tip(self):
+        """Test that the ls-remote freshness check tracks new remote commits."""
+        from src.lib.git_ops import GitOperations
+
+        git_ops = GitOperations()
+
+        repo = Repo.init(self.temp_repo_dir)
+        test_file = Path(self.temp_repo_dir) / "config.txt"
+        test_file.write_text("version 1")
+        repo.index.add(["config.txt"])
+        repo.index.commit("version 1")
+
+        repo_url = f"file://{self.temp_repo_dir}"
+        clone_path = Path(self.temp_clone_dir)
+        assert git_ops.clone_repository(repo_url, clone_path)
+        assert git_ops.is_up_to_date(clone_path, repo_url, "main")
+        assert not git_ops.is_up_to_date(clone_path, repo_url, "missing-branch")
+
+        test_file.write_text("version 2")
+        repo.index.add(["config.txt"])
+        repo.index.commit("version 2")
+        assert not git_ops.is_up_to_date(clone_path, repo_url, "main")
+
+    def test_get_template_by_name_probes_template_directory(self):
+        """Test that a named template is found without discovering the others."""
+        from unittest.mock import patch
+
+        import pytest
+
+        from src.lib.git_ops import GitOperations
+        from src.models.template import TemplateType
+        from src.lib.command_base import ConfigurationError
+
+        git_ops = GitOperations()
+
+        repo_path = Path(self.temp_repo_dir)
+        template_dir = repo_path / "projects" / "python"
+        template_dir.mkdir(parents=True)
+        (template_dir / "pyproject.toml").write_text("[project]")
+
+        with patch.object(git_ops, "discover_templates", side_effect=AssertionError("walked repository")):
+            template = git_ops.get_template_by_name(repo_path, "python", TemplateType.PROJECT)
+        assert template.name == "python"
+        assert template.type == TemplateType.PROJECT
+
+        with pytest.raises(ConfigurationError):
+            git_ops.get_template_by_name(repo_path, "../projects", TemplateType.PROJECT)
+        with pytest.raises(ConfigurationError):
+            git_ops.get_template_by_name(repo_path, "python", TemplateType.DOTFILES)
+
+    def test_get_template_by_name_resolves_name_collisions_like_discovery(self):
+        """Test that a name used by both template types resolves to the last match in discovery order."""
+        from src.lib.git_ops import GitOperations
+        from src.models.template import TemplateType
+
+        git_ops = GitOperations()
+
+        repo_path = Path(self.temp_repo_dir)
+        for dir_name, file_name in [("dotfiles", ".vimrc"), ("projects", "README.md")]:
+            template_dir = repo_path / dir_name / "vim"
+            template_dir.mkdir(parents=True)
+            (template_dir / file_name).write_text("")
+
+        last_discovered = {t.name: t for t in git_ops.discover_templates(repo_path)}["vim"]
+        template = git_ops.get_template_by_name(repo_path, "vim")
+        assert template.type == last_discovered.type == TemplateType.PROJECT
+        assert template.files == ["README.md"]
+
+        # An empty projects directory is not a template, so the dotfiles one is found
+        (repo_path / "projects" / "vim" / "README.md").unlink()
+        assert git_ops.get_template_by_name(repo_path, "vim").type == TemplateType.DOTFILES
+
+    def test_discovers_many_templates_in_name_order(self):
+        """Test that discovering a larger template set returns every template, sorted, with nested files."""
+        from src.lib.git_ops import GitOperations
+        from src.models.template import TemplateType
+
+        git_ops = GitOperations()
+
+        repo_path = Path(self.temp_repo_dir)
+        names = [f"tool{i}" for i in range(9, -1, -1)]
+        for name in names:
+            template_dir = repo_path / "dotfiles" / name
+            (template_dir / ".config" / name).mkdir(parents=True)
+            (template_dir / ".config" / name / "config").write_text(name)
+            (template_dir / "install.sh").write_text("#!/bin/sh")
+        (repo_path / "dotfiles" / "empty").mkdir()
+
+        templates = git_ops.discover_templates(repo_path, TemplateType.DOTFILES)
+
+        assert [t.name for t in templates] == sorted(names)
+        for template in templates:
+            assert template.files == [f".config/{template.name}/config"]
+            assert template.install_script == "install.sh"
+
+    def test_fresh_cache_still_syncs_when_branch_changes(self):
+        """Test that the sync TTL does not keep serving a cache checked out on another branch."""
+        import os
+
+        from src.lib.git_ops import GitOperations
+        from src.lib.command_base import CommandContext, sync_repo_if_needed
+        from src.models.config_loader import CLIConfig
+
+        repo = Repo.init(self.temp_repo_dir, initial_branch="main")
+        test_file = Path(self.temp_repo_dir) / "config.txt"
+        test_file.write_text("main")
+        repo.index.add(["config.txt"])
+        repo.index.commit("main")
+        repo.git.checkout("-b", "develop")
+        test_file.write_text("develop")
+        repo.index.add(["config.txt"])
+        repo.index.commit("develop")
+        repo.git.checkout("main")
+
+        # The URL validator only admits remote schemes; a file:// remote keeps the test offline
+        config = CLIConfig.model_construct(
+            default_repo_url=f"file://{self.temp_repo_dir}", config_dir=Path(self.temp_clone_dir)
+        )
+        git_ops = GitOperations()
+        sync_repo_if_needed(CommandContext(config=config), git_ops)
+        cache_dir = config.get_repo_cache_dir()
+        assert git_ops.seconds_since_sync(cache_dir) is not None
+
+        config.repo_branch = "develop"
+        sync_repo_if_needed(CommandContext(config=config, repo_cache_stat=os.stat(cache_dir)), git_ops)
+
+        assert (cache_dir / ".git" / "HEAD").read_text().strip() == "ref: refs/heads/develop"
+        assert (cache_dir / "config.txt").read_text() == "develop"
+
+    def test_sync_sentinel_tracks_last_sync_age(self):
+        """Test that marking a repository synced makes it report a fresh age."""
+        from src.lib.git_ops import GitOperations
+
+        git_ops = GitOperations()
+        Repo.init(self.temp_repo_dir)
+        repo_path = Path(self.temp_repo_dir)
+
+        assert git_ops.seconds_since_sync(repo_path) is None
+
+        git_ops.mark_synced(repo_path)
+        age = git_ops.seconds_since_sync(repo_path)
+        assert age is not None
+        assert 0 <= age < 60